@@ -15,6 +15,7 @@ from navconfig.logging import logging
 from navigator_auth import AuthHandler
 ##  Navigator
 from navigator.handlers.types import AppHandler
+from asyncdb import AsyncPool
 from rewards.conf import (
     default_dsn,
     rabbitmq_dsn,
@@ -97,6 +98,29 @@ class Main(AppHandler):
         on_startup.
         description: Signal for customize the response when server is started
         """
+        # Application-wide connection pool: views without an explicit DSN
+        # acquire from app['database'], so warming the pool here means no
+        # request ever pays TCP + TLS + auth connection setup.
+        if 'database' not in app:
+            # Sized for observed handler concurrency: warm connections for
+            # the steady state, headroom for mystery-box fan-out bursts.
+            # The pg driver registers orjson-backed json/jsonb codecs on
+            # every pooled connection, and asyncpg decodes text[] columns
+            # (e.g. prize tags) natively, so jsonb/array round-trips need
+            # no extra configuration here.
+            pool = AsyncPool(
+                'pg',
+                dsn=default_dsn,
+                min_size=10,
+                max_clients=50,
+                max_inactive_timeout=300,
+                server_settings={
+                    'application_name': 'NAV-Rewards',
+                    'tcp_keepalives_idle': '30'
+                }
+            )
+            await pool.connect()
+            app['database'] = pool
 
     async def on_shutdown(self, app):
         """
@@ -104,4 +128,6 @@ class Main(AppHandler):
         description: Signal for customize the response when server is
         shutting down
         """
-        pass
+        pool = app.get('database')
+        if pool is not None:
+            await pool.close()
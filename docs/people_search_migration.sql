@@ -0,0 +1,78 @@
+--- People Search: trigram indexes for ADPeopleSearchHandler
+--- Leading-wildcard ILIKE ('%query%') cannot use a B-tree index and forces
+--- a sequential scan on troc.people. pg_trgm GIN indexes let the planner
+--- turn the same ILIKE predicates into bitmap index scans.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+--- Indexes go on the base table backing troc.vw_people, not on the view.
+--- Note: CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS people_display_name_trgm
+ON troc.people USING gin (display_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS people_given_name_trgm
+ON troc.people USING gin (given_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS people_last_name_trgm
+ON troc.people USING gin (last_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS people_email_trgm
+ON troc.people USING gin (email gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS people_username_trgm
+ON troc.people USING gin (username gin_trgm_ops);
+
+--- Verify with:
+---   EXPLAIN (ANALYZE, BUFFERS)
+---   SELECT * FROM troc.vw_people WHERE display_name ILIKE '%smith%' LIMIT 100;
+--- A "Bitmap Index Scan on people_display_name_trgm" should replace the Seq Scan.
+
+--- Full-text search column for multi-word queries.
+--- A single weighted tsvector replaces five OR'ed ILIKE probes and lets the
+--- results be ordered by relevance (ts_rank_cd) instead of alphabetically.
+ALTER TABLE troc.people
+ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(display_name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(email, '')), 'B') ||
+    setweight(to_tsvector('simple',
+        coalesce(given_name, '') || ' ' ||
+        coalesce(last_name, '') || ' ' ||
+        coalesce(username, '')), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS people_search_tsv_gin
+ON troc.people USING gin (search_tsv);
+
+--- Expose the column through the view:
+---   CREATE OR REPLACE VIEW troc.vw_people AS SELECT ..., p.search_tsv FROM troc.people p ...;
+--- The trigram indexes above remain as a fallback for substring searches
+--- shorter than a full lexeme.
+
+--- Covering B-tree for alphabetical listings of the narrow search
+--- projection; with a fresh visibility map this allows index-only scans.
+CREATE INDEX IF NOT EXISTS people_display_name_btree
+ON troc.people (display_name);
+
+--- Run VACUUM ANALYZE troc.people afterwards so the visibility map lets
+--- the planner skip heap fetches on the LIMIT path.
+
+--- Single concatenated search column for substring (ILIKE) lookups.
+--- One trigram index probe replaces the BitmapOr over the five
+--- per-column trigram indexes above, which can then be dropped:
+---   DROP INDEX CONCURRENTLY IF EXISTS troc.people_display_name_trgm;
+---   DROP INDEX CONCURRENTLY IF EXISTS troc.people_given_name_trgm;
+---   DROP INDEX CONCURRENTLY IF EXISTS troc.people_last_name_trgm;
+---   DROP INDEX CONCURRENTLY IF EXISTS troc.people_email_trgm;
+---   DROP INDEX CONCURRENTLY IF EXISTS troc.people_username_trgm;
+ALTER TABLE troc.people
+ADD COLUMN search_blob text GENERATED ALWAYS AS (
+    coalesce(display_name, '') || ' ' ||
+    coalesce(given_name, '') || ' ' ||
+    coalesce(last_name, '') || ' ' ||
+    coalesce(email, '') || ' ' ||
+    coalesce(username, '')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS people_search_blob_trgm
+ON troc.people USING gin (search_blob gin_trgm_ops);
+
+--- Remember to expose search_blob through troc.vw_people as well.
@@ -2,12 +2,37 @@
 App Views.
 """
 from typing import Union
-from asyncdb.exceptions import NoDataFound
 from navigator.views import ModelView
 from navigator_auth.models import UserDevices
 from .models import APIKeys
 from uuid import uuid4
 
+
+def _device_template() -> tuple:
+    """
+    Precompute the UserDevices serialization template once per process.
+
+    The POST path only needs the field layout and defaults of UserDevices,
+    not a validated instance, so the static defaults are frozen here and
+    only callable defaults (datetime.now, etc.) are evaluated per request.
+    """
+    template = {}
+    factories = {}
+    for name, field in UserDevices.get_columns().items():
+        if name == 'issuer':
+            continue
+        default = field.default
+        if callable(default):
+            factories[name] = default
+            template[name] = None
+        else:
+            template[name] = default
+    return template, factories
+
+
+_USER_DEVICE_TEMPLATE, _USER_DEVICE_FACTORIES = _device_template()
+
+
 class APIKeysView(ModelView):
     model = APIKeys
     pk: list = ['user_id', 'device_id']
@@ -24,13 +49,18 @@ class APIKeysView(ModelView):
             # estoy creando un nuevo api key
             params = {
                 "created_by": self._userid,
-                "device_id": uuid4(),
+                # .hex skips the UUID object's __str__ on serialization;
+                # the uuid column converts it back on insert.
+                "device_id": uuid4().hex,
                 **data
             }
-            # Create API Key
-            result = UserDevices(**params)
-            response = result.to_dict()
-            del response['issuer']
+            # Merge over the precomputed template instead of paying
+            # datamodel validation for a throwaway instance.
+            response = {
+                **_USER_DEVICE_TEMPLATE,
+                **{k: f() for k, f in _USER_DEVICE_FACTORIES.items()},
+                **params
+            }
         return response
 
     async def delete(self):
@@ -48,25 +78,29 @@ class APIKeysView(ModelView):
         if payload:
             if 'device_id' in payload:
                 device_id = payload.get('device_id')
-            if payload is not None:
-                user_id = payload.user_id
-                name = payload.name
+            user_id = payload.get('user_id')
+            name = payload.get('name')
         async with await self.handler(request=self.request) as conn:
-            self.model.Meta.connection = conn
-            try:
-                if device_id:
-                    api_key = await self.model.get(
-                        device_id=device_id
-                    )
-                else:
-                    api_key = await self.model.get(user_id=user_id, name=name)
-                api_key.revoked = True
-                await api_key.update()
-                return self.json_response(status=200, response=api_key)
-            except NoDataFound:
+            # Single UPDATE ... RETURNING: one round trip instead of a
+            # SELECT followed by an UPDATE, and no mutation of the shared
+            # model Meta.connection.
+            if device_id:
+                api_key = await conn.fetch_one(
+                    "UPDATE auth.api_keys SET revoked = true "
+                    "WHERE device_id = $1 RETURNING *",
+                    device_id
+                )
+            else:
+                api_key = await conn.fetch_one(
+                    "UPDATE auth.api_keys SET revoked = true "
+                    "WHERE user_id = $1 AND name = $2 RETURNING *",
+                    user_id, name
+                )
+            if not api_key:
                 return self.error(
                     response={
                         "error": f"API Key not exists with user_id '{user_id }' and name '{name}'"
                     },
                     status=404
                 )
+            return self.json_response(status=200, response=dict(api_key))
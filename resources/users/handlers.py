@@ -1,3 +1,9 @@
+import asyncio
+import gzip
+import time
+import weakref
+import orjson
+from asyncpg import PostgresError
 from datamodel import BaseModel
 from navigator.views import ModelView
 from navigator.views.abstract import AbstractModel
@@ -6,6 +12,49 @@ from asyncdb.exceptions import NoDataFound
 from .models import ADUser, ADPeople
 
 
+# Module-level SQL literals: interned once, and stable keys for the
+# per-connection prepared-statement cache.
+# Full-text search against the weighted search_tsv column (see
+# docs/people_search_migration.sql), ordered by relevance; the raw query
+# is passed as-is, plainto_tsquery handles tokenization. Narrow projection:
+# only what the autocomplete UI renders.
+_PEOPLE_SEARCH_SQL = """
+    SELECT people_id, display_name, given_name, last_name,
+           email, username,
+           ts_rank_cd(search_tsv, q) AS rank
+    FROM troc.vw_people, plainto_tsquery('simple', $1) q
+    WHERE search_tsv @@ q
+    ORDER BY rank DESC
+    LIMIT 100
+"""
+
+# Substring fallback for queries shorter than a full lexeme (partial
+# emails, fragments of usernames): one ILIKE probe against the
+# concatenated search_blob column served by a single trigram index.
+_PEOPLE_SEARCH_FALLBACK_SQL = """
+    SELECT people_id, display_name, given_name, last_name,
+           email, username
+    FROM troc.vw_people
+    WHERE search_blob ILIKE $1
+    ORDER BY display_name
+    LIMIT 100
+"""
+
+
+# Escape ILIKE wildcards in user input before wrapping it in %...%:
+# a raw '%' or '_' from the client would defeat trigram selectivity and
+# degenerate into a full scan. One C-level translate per request.
+_ILIKE_ESCAPE = str.maketrans({'\\': r'\\', '%': r'\%', '_': r'\_'})
+
+
+def _record_default(obj):
+    """orjson fallback: asyncpg Records become dicts, stragglers strings."""
+    try:
+        return dict(obj)
+    except TypeError:
+        return str(obj)
+
+
 class ADUserHandler(ModelView):
     model: BaseModel = ADUser
     pk: str = 'people_id'
@@ -20,43 +69,149 @@ class ADPeopleSearchHandler(AbstractModel):
     """Search handler for AD People."""
     path = 'ad_people/search'
     model = ADPeople
-    
+
+    # Prepared statements cached per asyncpg connection: statements survive
+    # as long as the pooled connection does, so PostgreSQL parses and plans
+    # the search query once per connection instead of once per request.
+    _stmt_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    # Short-TTL cache of serialized results keyed by normalized query:
+    # typeahead repeats the same queries keystroke-by-keystroke and the
+    # directory view tolerates a minute of staleness. The generation counter
+    # is bumped by people-import jobs to invalidate everything at once.
+    _search_cache: dict = {}
+    _search_cache_ttl: int = 60
+    _search_cache_maxsize: int = 512
+    _cache_generation: int = 0
+
+    # Single-flight futures for in-progress fills: concurrent misses on
+    # the same key await one fetch, while misses on different keys run
+    # in parallel (no lock ever spans the DB round trip).
+    _search_inflight: dict = {}
+
+    @classmethod
+    def invalidate_search_cache(cls):
+        """Drop all cached search results (e.g. after a people import)."""
+        cls._cache_generation += 1
+        cls._search_cache.clear()
+
+    async def _prepared_search(self, conn, sql: str):
+        """Get (or prepare once) the search statement for this connection."""
+        driver = conn.get_connection()
+        try:
+            statements = self._stmt_cache[driver]
+        except KeyError:
+            statements = self._stmt_cache[driver] = {}
+        stmt = statements.get(sql)
+        if stmt is None:
+            stmt = await driver.prepare(sql)
+            statements[sql] = stmt
+        return stmt
+
+    async def _search_people(self, query: str) -> bytes:
+        """Run the people search and return the serialized JSON payload."""
+        async with await self.handler(request=self.request) as conn:
+            stmt = await self._prepared_search(conn, _PEOPLE_SEARCH_SQL)
+            result = await stmt.fetch(query)
+
+            if not result:
+                stmt = await self._prepared_search(
+                    conn, _PEOPLE_SEARCH_FALLBACK_SQL
+                )
+                result = await stmt.fetch(
+                    f"%{query.translate(_ILIKE_ESCAPE)}%"
+                )
+
+            # Serialize the Record list straight to bytes: the default hook
+            # converts each Record in C-driven traversal, skipping the
+            # Python-level append loop and its N dict allocations.
+            return orjson.dumps(list(result), default=_record_default)
+
     async def get(self):
         """Search for people by query string across multiple fields."""
         qp = self.query_parameters(self.request)
         query = qp.get('query', '').strip()
-        
+
         if not query:
             return self.json_response(
                 {"error": "Query parameter is required"},
                 status=400
             )
-        
-        search_pattern = f"%{query}%"
-        
+
+        # 1-2 character queries match virtually every row (pg_trgm works on
+        # 3-grams, so shorter inputs cannot prune the posting lists); bound
+        # the worst case here instead of paying a near-seq-scan in the DB.
+        if len(query) < 3:
+            return self.json_response([])
+
+        accepts_gzip = 'gzip' in self.request.headers.get(
+            'Accept-Encoding', ''
+        )
+        key = (self._cache_generation, query.lower())
+        now = time.monotonic()
+        entry = self._search_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return self._cached_response(entry, accepts_gzip)
+
         try:
-            async with await self.handler(request=self.request) as conn:
-                sql = """
-                    SELECT * FROM troc.vw_people 
-                    WHERE display_name ILIKE $1 
-                       OR given_name ILIKE $1 
-                       OR last_name ILIKE $1 
-                       OR email ILIKE $1 
-                       OR username ILIKE $1
-                    ORDER BY display_name
-                    LIMIT 100
-                """
-                
-                result = await conn.fetchall(sql, search_pattern)
-            
-                data = []
-                for row in result:
-                    data.append(dict(row))
-                
-                return self.json_response(data)
-                
-        except Exception as err:
+            entry = await self._fill_search_cache(key, query)
+            return self._cached_response(entry, accepts_gzip)
+
+        except PostgresError as err:
+            # Only database errors map to a 500 here; cancellation and
+            # programming errors bubble up to the aiohttp middleware so
+            # abandoned requests don't leave zombie tasks behind.
             return self.error(
                 response={"error": f"Search failed: {str(err)}"},
                 status=500
             )
+
+    async def _fill_search_cache(self, key: tuple, query: str) -> tuple:
+        """Fetch, serialize and cache the results for key, single-flight.
+
+        Only the first miss on a key issues the query; concurrent misses
+        on the same key await its future instead of duplicating the
+        fetch, and misses on different keys proceed independently.
+        """
+        fut = self._search_inflight.get(key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._search_inflight[key] = fut
+        try:
+            body = await self._search_people(query)
+            if len(self._search_cache) >= self._search_cache_maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._search_cache.pop(
+                    next(iter(self._search_cache))
+                )
+            # Compress once at fill time (level 1: cheap, typeahead
+            # payloads compress well) so hot queries are served
+            # straight from RAM with no DB, encode or gzip work.
+            entry = (
+                time.monotonic() + self._search_cache_ttl,
+                body,
+                gzip.compress(body, 1)
+            )
+            self._search_cache[key] = entry
+            fut.set_result(entry)
+        except BaseException as err:
+            fut.set_exception(err)
+            raise
+        finally:
+            self._search_inflight.pop(key, None)
+        return entry
+
+    def _cached_response(self, entry: tuple, accepts_gzip: bool):
+        """Build a response from a cache entry, precompressed if accepted."""
+        _, body, gz_body = entry
+        headers = {'Vary': 'Accept-Encoding'}
+        if accepts_gzip:
+            body = gz_body
+            headers['Content-Encoding'] = 'gzip'
+        return web.Response(
+            body=body,
+            content_type='application/json',
+            headers=headers
+        )
@@ -36,55 +36,74 @@ Quick Start:
         winner_count=5
     )
 """
-from .models import (
+import importlib
+
+# Lazy (PEP 562) exports: each submodule is imported on first attribute
+# access only, so callers that just need an enum or a model don't pull in
+# the whole handlers/service/scheduler subtree at worker startup.
+_LAZY = {
     # Core Models
-    PrizeCatalog,
-    PrizeAward,
-    PrizeRedemption,
-    PrizeCategory,
-    PrizeTier,
-    MysteryBoxEvent,
-    RedemptionStatusHistory,
+    'PrizeCatalog': '.models',
+    'PrizeAward': '.models',
+    'PrizeRedemption': '.models',
+    'PrizeCategory': '.models',
+    'PrizeTier': '.models',
+    'MysteryBoxEvent': '.models',
+    'RedemptionStatusHistory': '.models',
 
     # Enums
-    AwardStatus,
-    AwardSource,
-    RedemptionStatus,
-    FulfillmentType,
-    StockStatus,
+    'AwardStatus': '.models',
+    'AwardSource': '.models',
+    'RedemptionStatus': '.models',
+    'FulfillmentType': '.models',
+    'StockStatus': '.models',
 
     # View Models
-    UserPrizeWallet,
-    PrizeCatalogView,
-    RedemptionMetrics,
-)
-
-from .service import (
-    MarketplaceService,
-    AwardResult,
-    RedemptionResult,
-    MysteryBoxResult,
-)
-
-from .handlers import (
-    PrizeCatalogHandler,
-    PrizeAwardHandler,
-    PrizeRedemptionHandler,
-    MysteryBoxHandler,
-    UserWalletHandler,
-    PrizeCategoryHandler,
-    PrizeTierHandler,
-    RedemptionMetricsHandler,
-    setup_marketplace_routes,
-)
-
-from .mystery import (
-    MysteryBoxRule,
-    MysteryBoxReward,
-    random_mystery_box_event,
-    expire_old_prizes,
-    register_mystery_box_jobs,
-)
+    'UserPrizeWallet': '.models',
+    'PrizeCatalogView': '.models',
+    'RedemptionMetrics': '.models',
+    'view_from_row': '.models',
+    'serialize_views': '.models',
+
+    # Service
+    'MarketplaceService': '.service',
+    'AwardResult': '.service',
+    'RedemptionResult': '.service',
+    'MysteryBoxResult': '.service',
+
+    # Handlers
+    'PrizeCatalogHandler': '.handlers',
+    'PrizeAwardHandler': '.handlers',
+    'PrizeRedemptionHandler': '.handlers',
+    'MysteryBoxHandler': '.handlers',
+    'UserWalletHandler': '.handlers',
+    'list_prize_categories': '.handlers',
+    'list_prize_tiers': '.handlers',
+    'RedemptionMetricsHandler': '.handlers',
+    'setup_marketplace_routes': '.handlers',
+
+    # Mystery Box
+    'MysteryBoxRule': '.mystery',
+    'MysteryBoxReward': '.mystery',
+    'random_mystery_box_event': '.mystery',
+    'expire_old_prizes': '.mystery',
+    'register_mystery_box_jobs': '.mystery',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [
@@ -108,6 +127,8 @@ __all__ = [
     'UserPrizeWallet',
     'PrizeCatalogView',
     'RedemptionMetrics',
+    'view_from_row',
+    'serialize_views',
 
     # Service
     'MarketplaceService',
@@ -121,8 +142,8 @@ __all__ = [
     'PrizeRedemptionHandler',
     'MysteryBoxHandler',
     'UserWalletHandler',
-    'PrizeCategoryHandler',
-    'PrizeTierHandler',
+    'list_prize_categories',
+    'list_prize_tiers',
     'RedemptionMetricsHandler',
     'setup_marketplace_routes',
 
@@ -8,6 +8,9 @@
 --   4. Mystery Box Events - Random prize distribution system
 -- ============================================================================
 
+-- gen_random_bytes() for redemption-code generation.
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
 -- ============================================================================
 -- PRIZE CATALOG TABLES
 -- ============================================================================
@@ -134,6 +137,10 @@ CREATE INDEX IF NOT EXISTS idx_prize_catalog_tier ON rewards.prize_catalog(tier_
 CREATE INDEX IF NOT EXISTS idx_prize_catalog_active ON rewards.prize_catalog(is_active) WHERE is_active = TRUE;
 CREATE INDEX IF NOT EXISTS idx_prize_catalog_mystery ON rewards.prize_catalog(is_mystery_eligible, tier_id) WHERE is_mystery_eligible = TRUE;
 CREATE INDEX IF NOT EXISTS idx_prize_catalog_featured ON rewards.prize_catalog(is_featured) WHERE is_featured = TRUE;
+-- Partial index matching the catalog list predicate (active, not
+-- deleted) with featured-first ordering.
+CREATE INDEX IF NOT EXISTS idx_prize_catalog_active_feat ON rewards.prize_catalog(is_featured DESC, prize_id)
+    WHERE is_active = TRUE AND deleted_at IS NULL;
 
 -- ============================================================================
 -- PRIZE AWARDS TABLE (Prizes given to users)
@@ -220,12 +227,18 @@ CREATE TABLE IF NOT EXISTS rewards.prize_awards (
 );
 
 -- Indexes for prize_awards
-CREATE INDEX IF NOT EXISTS idx_prize_awards_user ON rewards.prize_awards(user_id);
+-- (user_id, awarded_at DESC) backs the wallet view's per-user scan and
+-- hands rows back already in display order, skipping the sort node.
+CREATE INDEX IF NOT EXISTS idx_prize_awards_user ON rewards.prize_awards(user_id, awarded_at DESC);
 CREATE INDEX IF NOT EXISTS idx_prize_awards_prize ON rewards.prize_awards(prize_id);
 CREATE INDEX IF NOT EXISTS idx_prize_awards_status ON rewards.prize_awards(status);
 CREATE INDEX IF NOT EXISTS idx_prize_awards_source ON rewards.prize_awards(source);
 CREATE INDEX IF NOT EXISTS idx_prize_awards_expires ON rewards.prize_awards(expires_at) WHERE expires_at IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_prize_awards_user_status ON rewards.prize_awards(user_id, status);
+-- Partial index for the expiry sweep: only 'available' awards are ever
+-- expired, so the index covers just the hot subset.
+CREATE INDEX IF NOT EXISTS idx_prize_awards_available_exp ON rewards.prize_awards(expires_at)
+    WHERE status = 'available' AND expires_at IS NOT NULL;
 
 -- ============================================================================
 -- PRIZE REDEMPTIONS TABLE (Redemption tracking with full audit)
@@ -291,10 +304,14 @@ CREATE TABLE IF NOT EXISTS rewards.prize_redemptions (
     user_feedback TEXT,
     feedback_at TIMESTAMPTZ,
 
-    -- Metrics (calculated durations)
-    time_to_approve_seconds BIGINT,
-    time_to_complete_seconds BIGINT,
-    total_processing_seconds BIGINT,
+    -- Metrics: derived from the timestamp columns by Postgres itself,
+    -- so they can never drift from the timestamps they summarize.
+    time_to_approve_seconds BIGINT GENERATED ALWAYS AS
+        (EXTRACT(EPOCH FROM (approved_at - initiated_at))::BIGINT) STORED,
+    time_to_complete_seconds BIGINT GENERATED ALWAYS AS
+        (EXTRACT(EPOCH FROM (completed_at - initiated_at))::BIGINT) STORED,
+    total_processing_seconds BIGINT GENERATED ALWAYS AS
+        (EXTRACT(EPOCH FROM (completed_at - created_at))::BIGINT) STORED,
 
     -- Notes & Communication
     admin_notes TEXT,
@@ -513,20 +530,19 @@ ORDER BY event_date DESC;
 CREATE OR REPLACE FUNCTION rewards.generate_redemption_code()
 RETURNS VARCHAR(100) AS $$
 DECLARE
-    chars TEXT := 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789';
+    chars CONSTANT TEXT := 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789';
+    raw BYTEA := gen_random_bytes(10);
     result TEXT := '';
     i INT;
 BEGIN
-    -- Format: RDM-XXXXX-XXXXX
-    result := 'RDM-';
-    FOR i IN 1..5 LOOP
-        result := result || SUBSTR(chars, FLOOR(RANDOM() * LENGTH(chars) + 1)::INT, 1);
-    END LOOP;
-    result := result || '-';
-    FOR i IN 1..5 LOOP
-        result := result || SUBSTR(chars, FLOOR(RANDOM() * LENGTH(chars) + 1)::INT, 1);
+    -- Format: RDM-XXXXX-XXXXX. One gen_random_bytes() draw; each byte
+    -- masked to 5 bits indexes the 32-character alphabet, mirroring
+    -- the service's in-process generator: cryptographically random and
+    -- uniform, unlike the non-crypto RANDOM() this replaced.
+    FOR i IN 0..9 LOOP
+        result := result || SUBSTR(chars, (GET_BYTE(raw, i) & 31) + 1, 1);
     END LOOP;
-    RETURN result;
+    RETURN 'RDM-' || SUBSTR(result, 1, 5) || '-' || SUBSTR(result, 6, 5);
 END;
 $$ LANGUAGE plpgsql;
 
@@ -536,6 +552,13 @@ RETURNS TRIGGER AS $$
 BEGIN
     -- Only update if prize has limited quantity
     IF (SELECT total_quantity FROM rewards.prize_catalog WHERE prize_id = NEW.prize_id) IS NOT NULL THEN
+        -- Serialize decrements per prize with a transaction-scoped
+        -- advisory lock: concurrent awards for the same prize queue on
+        -- the lock instead of contending on the catalog row itself.
+        -- Awards are inserted in ascending prize_id order, so lock
+        -- acquisition order is stable and cycle-free.
+        PERFORM pg_advisory_xact_lock(hashtext('prize:' || NEW.prize_id));
+
         UPDATE rewards.prize_catalog
         SET
             available_quantity = available_quantity - 1,
@@ -558,6 +581,92 @@ CREATE TRIGGER trg_update_stock_on_award
     FOR EACH ROW
     EXECUTE FUNCTION rewards.update_prize_stock_on_award();
 
+-- Per-(prize, user) award history summary, maintained incrementally so
+-- the award path's max-per-user/cooldown check is an O(1) primary-key
+-- lookup instead of a COUNT(*)/MAX() scan over the user's history.
+CREATE TABLE IF NOT EXISTS rewards.prize_award_summary (
+    prize_id INT NOT NULL REFERENCES rewards.prize_catalog(prize_id),
+    user_id INT NOT NULL,
+    awards_count INT NOT NULL DEFAULT 0,
+    last_awarded_at TIMESTAMPTZ,
+    PRIMARY KEY (prize_id, user_id)
+);
+
+-- Function: Maintain the award summary (cancelled awards don't count)
+CREATE OR REPLACE FUNCTION rewards.maintain_prize_award_summary()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        IF NEW.status != 'cancelled' THEN
+            INSERT INTO rewards.prize_award_summary AS s
+                (prize_id, user_id, awards_count, last_awarded_at)
+            VALUES (NEW.prize_id, NEW.user_id, 1, NEW.awarded_at)
+            ON CONFLICT (prize_id, user_id) DO UPDATE
+            SET awards_count = s.awards_count + 1,
+                last_awarded_at = GREATEST(
+                    s.last_awarded_at, EXCLUDED.last_awarded_at
+                );
+        END IF;
+        RETURN NEW;
+    ELSIF TG_OP = 'UPDATE' THEN
+        IF OLD.status != 'cancelled' AND NEW.status = 'cancelled' THEN
+            -- Recompute MAX on the rare cancel path; the row being
+            -- cancelled is already excluded by its new status.
+            UPDATE rewards.prize_award_summary s
+            SET awards_count = GREATEST(s.awards_count - 1, 0),
+                last_awarded_at = (
+                    SELECT MAX(awarded_at) FROM rewards.prize_awards
+                    WHERE prize_id = NEW.prize_id
+                      AND user_id = NEW.user_id
+                      AND status != 'cancelled'
+                )
+            WHERE s.prize_id = NEW.prize_id AND s.user_id = NEW.user_id;
+        ELSIF OLD.status = 'cancelled' AND NEW.status != 'cancelled' THEN
+            INSERT INTO rewards.prize_award_summary AS s
+                (prize_id, user_id, awards_count, last_awarded_at)
+            VALUES (NEW.prize_id, NEW.user_id, 1, NEW.awarded_at)
+            ON CONFLICT (prize_id, user_id) DO UPDATE
+            SET awards_count = s.awards_count + 1,
+                last_awarded_at = GREATEST(
+                    s.last_awarded_at, EXCLUDED.last_awarded_at
+                );
+        END IF;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        IF OLD.status != 'cancelled' THEN
+            UPDATE rewards.prize_award_summary s
+            SET awards_count = GREATEST(s.awards_count - 1, 0),
+                last_awarded_at = (
+                    SELECT MAX(awarded_at) FROM rewards.prize_awards
+                    WHERE prize_id = OLD.prize_id
+                      AND user_id = OLD.user_id
+                      AND status != 'cancelled'
+                )
+            WHERE s.prize_id = OLD.prize_id AND s.user_id = OLD.user_id;
+        END IF;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Trigger: Keep the summary in sync with prize_awards
+CREATE TRIGGER trg_maintain_award_summary
+    AFTER INSERT OR UPDATE OF status OR DELETE ON rewards.prize_awards
+    FOR EACH ROW
+    EXECUTE FUNCTION rewards.maintain_prize_award_summary();
+
+-- Backfill/repair from existing history (idempotent).
+INSERT INTO rewards.prize_award_summary
+    (prize_id, user_id, awards_count, last_awarded_at)
+SELECT prize_id, user_id, COUNT(*), MAX(awarded_at)
+FROM rewards.prize_awards
+WHERE status != 'cancelled'
+GROUP BY prize_id, user_id
+ON CONFLICT (prize_id, user_id) DO UPDATE
+SET awards_count = EXCLUDED.awards_count,
+    last_awarded_at = EXCLUDED.last_awarded_at;
+
 -- Function: Prevent duplicate redemption
 CREATE OR REPLACE FUNCTION rewards.prevent_duplicate_redemption()
 RETURNS TRIGGER AS $$
@@ -614,16 +723,14 @@ BEGIN
             NEW.metadata->>'changed_by'
         );
 
-        -- Update timing metrics
+        -- Set transition timestamps; the *_seconds metrics are
+        -- GENERATED columns computed from these automatically.
         IF NEW.status = 'approved' AND OLD.status != 'approved' THEN
             NEW.approved_at := NOW();
-            NEW.time_to_approve_seconds := EXTRACT(EPOCH FROM (NOW() - NEW.initiated_at))::BIGINT;
         END IF;
 
         IF NEW.status = 'completed' AND OLD.status != 'completed' THEN
             NEW.completed_at := NOW();
-            NEW.time_to_complete_seconds := EXTRACT(EPOCH FROM (NOW() - NEW.initiated_at))::BIGINT;
-            NEW.total_processing_seconds := EXTRACT(EPOCH FROM (NOW() - NEW.created_at))::BIGINT;
 
             -- Update award status to redeemed
             UPDATE rewards.prize_awards
@@ -742,3 +849,50 @@ COMMENT ON TABLE rewards.prize_catalog IS 'Catalog of all available prizes in th
 COMMENT ON TABLE rewards.prize_awards IS 'Prizes awarded to users - tracks from award to redemption';
 COMMENT ON TABLE rewards.prize_redemptions IS 'Redemption records with full audit trail and metrics';
 COMMENT ON TABLE rewards.mystery_box_events IS 'Mystery box event executions and results';
+
+-- ============================================================================
+-- MATERIALIZED VIEW: Prize Catalog
+-- ============================================================================
+-- Same projection as vw_prize_catalog, materialized so read-heavy catalog
+-- endpoints do a single indexed scan instead of a 4-way join per request.
+-- The unique index on prize_id allows REFRESH MATERIALIZED VIEW CONCURRENTLY;
+-- the service queues a refresh after every catalog write.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS rewards.mv_prize_catalog_view AS
+SELECT
+    pc.*,
+    pt.tier_name,
+    pt.tier_level,
+    pt.color_code AS tier_color,
+    pt.drop_rate,
+    pcat.category_name,
+    r.reward AS linked_badge_name,
+    r.icon AS linked_badge_icon,
+    -- Stock status
+    CASE
+        WHEN pc.total_quantity IS NULL THEN 'unlimited'
+        WHEN pc.available_quantity <= 0 THEN 'out_of_stock'
+        WHEN pc.available_quantity <= (pc.total_quantity * 0.1) THEN 'low_stock'
+        ELSE 'in_stock'
+    END AS stock_status,
+    -- Effective availability
+    COALESCE(pc.available_quantity, 999999) - COALESCE(pc.reserved_quantity, 0) AS effective_quantity
+FROM rewards.prize_catalog pc
+LEFT JOIN rewards.prize_tiers pt ON pc.tier_id = pt.tier_id
+LEFT JOIN rewards.prize_categories pcat ON pc.category_id = pcat.category_id
+LEFT JOIN rewards.rewards r ON pc.linked_reward_id = r.reward_id
+WHERE pc.deleted_at IS NULL
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_prize_catalog_prize_id
+    ON rewards.mv_prize_catalog_view (prize_id);
+
+-- Covers the catalog sort order so keyset pagination resumes from the
+-- cursor without scanning and discarding earlier rows. tier_level is
+-- coalesced to match the query: untiered prizes (NULL from the LEFT
+-- JOIN) sort below tier 1 instead of wherever NULLS land.
+DROP INDEX IF EXISTS rewards.idx_mv_prize_catalog_order;
+CREATE INDEX IF NOT EXISTS idx_mv_prize_catalog_order
+    ON rewards.mv_prize_catalog_view (
+        is_featured DESC, (COALESCE(tier_level, 0)) DESC, prize_name, prize_id
+    );
@@ -9,28 +9,383 @@ Provides REST endpoints for:
 - Mystery box events
 """
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-import json
-
+from datetime import datetime, timezone
+from enum import Enum
+import asyncio
+import hashlib
+import time
+import weakref
+
+import orjson
+import fastjsonschema
 from aiohttp import web
+from navconfig.logging import logging
 from navigator.views import BaseView
 from navigator_auth.handlers import AuthHandler
 from datamodel.exceptions import ValidationError
 
 from .models import (
     PrizeCatalog,
-    PrizeAward,
     PrizeRedemption,
     PrizeCategory,
     PrizeTier,
-    MysteryBoxEvent,
     AwardSource,
     RedemptionStatus,
 )
-from .service import MarketplaceService, AwardResult, RedemptionResult
+from .service import (
+    MarketplaceService,
+    AwardResult,
+    RedemptionResult,
+    decode_catalog_cursor,
+    invalidate_prize_pool_cache,
+)
+
+
+_logger = logging.getLogger('Rewards.Marketplace.API')
+
+_ADMIN_GROUPS = frozenset({'admin', 'rewards_admin'})
+
+
+def _is_admin(session: dict) -> bool:
+    """Check if the session belongs to a marketplace admin."""
+    return not _ADMIN_GROUPS.isdisjoint(session.get('groups', ()))
+
+
+# Payload validators compiled once at import: each request then runs
+# straight-line generated code instead of ad-hoc field loops, and bad
+# payloads are rejected before any service work is done.
+AWARD_VALIDATOR = fastjsonschema.compile({
+    "type": "object",
+    "required": ["prize_id", "user_id", "user_email"],
+    "properties": {
+        "prize_id": {"type": "integer"},
+        "user_id": {"type": "integer"},
+        "user_email": {"type": "string"},
+        "source": {"type": "string"},
+        "source_reference_id": {"type": ["integer", "null"]},
+        "source_reference_type": {"type": ["string", "null"]},
+        "linked_award_id": {"type": ["integer", "null"]},
+        "message": {"type": ["string", "null"]},
+        "expires_in_days": {"type": ["integer", "null"]},
+        "metadata": {"type": ["object", "null"]},
+        "user_employee_id": {"type": ["string", "null"]},
+    },
+})
+
+REDEMPTION_VALIDATOR = fastjsonschema.compile({
+    "type": "object",
+    "required": ["award_id"],
+    "properties": {
+        "award_id": {"type": "integer"},
+        "fulfillment_method": {"type": ["string", "null"]},
+        "shipping_address": {"type": ["object", "null"]},
+        "metadata": {"type": ["object", "null"]},
+    },
+})
+
+PRIZE_VALIDATOR = fastjsonschema.compile({
+    "type": "object",
+    "required": ["prize_name"],
+    "properties": {
+        "prize_name": {"type": "string", "maxLength": 255},
+        "description": {"type": ["string", "null"]},
+        "short_description": {"type": ["string", "null"], "maxLength": 500},
+        "category_id": {"type": ["integer", "null"]},
+        "tier_id": {"type": ["integer", "null"]},
+        "points_cost": {"type": "integer"},
+        "monetary_value": {"type": ["number", "string", "null"]},
+        "total_quantity": {"type": ["integer", "null"]},
+        "available_quantity": {"type": ["integer", "null"]},
+        "max_per_user": {"type": ["integer", "null"]},
+        "cooldown_days": {"type": "integer"},
+        "requires_approval": {"type": "boolean"},
+        "is_active": {"type": "boolean"},
+        "is_featured": {"type": "boolean"},
+        "is_mystery_eligible": {"type": "boolean"},
+        "mystery_weight": {"type": "integer"},
+        "fulfillment_type": {"type": "string"},
+        "linked_reward_id": {"type": ["integer", "null"]},
+        "tags": {"type": ["array", "null"]},
+    },
+})
+
+
+_TRUE = {'true', 'True', 'TRUE', '1', 'yes'}
+
+# Plain dict lookups instead of Enum.__call__, which walks the enum
+# machinery on every create/status request.
+_AWARD_SOURCES = {m.value: m for m in AwardSource}
+_REDEMPTION_STATUSES = {m.value: m for m in RedemptionStatus}
+
+# (query param, converter, default) specs consumed by _parse_query.
+_CATALOG_QUERY_SPEC = (
+    ('category_id', int, None),
+    ('tier_id', int, None),
+    ('is_active', bool, True),
+    ('is_featured', bool, None),
+    ('in_stock_only', bool, False),
+    ('mystery_eligible', bool, False),
+    ('search', str, None),
+    ('limit', int, 50),
+    ('offset', int, 0),
+    ('after', str, None),
+)
+
+_EVENTS_QUERY_SPEC = (
+    ('status', str, None),
+    ('limit', int, 20),
+    ('offset', int, 0),
+    ('stream', bool, False),
+)
+
+_WALLET_QUERY_SPEC = (
+    ('status', str, None),
+    ('include_expired', bool, False),
+)
+
+
+def _parse_query(params, spec) -> dict:
+    """
+    Coerce query parameters in a single pass over a converter spec.
+
+    Replaces the per-field .lower() == 'true' tests and scattered int()
+    casts that every list request paid.
+    """
+    parsed = {}
+    get = params.get
+    for name, conv, default in spec:
+        raw = get(name)
+        if raw is None:
+            parsed[name] = default
+        elif conv is bool:
+            parsed[name] = raw in _TRUE
+        else:
+            parsed[name] = conv(raw)
+    return parsed
+
+
+async def _parse_body(request: web.Request) -> dict:
+    """
+    Parse the JSON request body with orjson.
+
+    aiohttp's request.json() goes through stdlib json; orjson decodes the
+    raw bytes directly, which matters for large create payloads and
+    mystery-box eligibility lists. Malformed bodies raise JSONDecodeError
+    (a ValueError), which the error middleware maps to 400.
+    """
+    return orjson.loads(await request.read())
+
+
+def _json_default(obj):
+    """orjson fallback for Decimal, Enum and other non-native types."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+# Event listing SQL as module constants: the same text object reaches
+# the per-connection statement cache every request, so Postgres never
+# re-parses or re-plans the hot list query.
+_EVENTS_STREAM_SQL = """
+    SELECT * FROM rewards.mystery_box_events
+    WHERE ($1::text IS NULL OR status = $1)
+    ORDER BY scheduled_at DESC
+"""
+
+_EVENTS_PAGE_SQL = """
+    SELECT * FROM rewards.mystery_box_events
+    WHERE ($1::text IS NULL OR status = $1)
+    ORDER BY scheduled_at DESC
+    LIMIT $2 OFFSET $3
+"""
+
+
+# TTL + ETag cache for rarely-changing reads (catalog, categories, tiers):
+# {key: (body_bytes, etag, expires_at)}. Hits skip the DB round trip and
+# JSON encode; matching If-None-Match short-circuits to a 304. Keys include
+# client-controlled values (search terms, cursors), so the cache is bounded:
+# oldest entry evicted at maxsize, expired entries dropped on miss.
+_catalog_cache: dict = {}
+_CATALOG_CACHE_TTL = 300
+_CATALOG_CACHE_MAXSIZE = 512
+
+
+def _cached_catalog_response(request, key):
+    """Return a cached response for key, a 304 if the ETag matches, or None."""
+    entry = _catalog_cache.get(key)
+    if entry is None:
+        return None
+    if entry[2] <= time.monotonic():
+        _catalog_cache.pop(key, None)
+        return None
+    body, etag, _ = entry
+    if request.headers.get('If-None-Match') == etag:
+        return web.Response(status=304, headers={'ETag': etag})
+    return web.Response(
+        body=body,
+        content_type='application/json',
+        headers={'ETag': etag}
+    )
+
+
+def _store_catalog_response(key, body: bytes):
+    """Cache the serialized body and return the response carrying its ETag."""
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if len(_catalog_cache) >= _CATALOG_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts keep insertion order).
+        _catalog_cache.pop(next(iter(_catalog_cache)))
+    _catalog_cache[key] = (body, etag, time.monotonic() + _CATALOG_CACHE_TTL)
+    return web.Response(
+        body=body,
+        content_type='application/json',
+        headers={'ETag': etag}
+    )
+
+
+def _invalidate_catalog_cache():
+    """Drop cached catalog responses after any catalog write."""
+    _catalog_cache.clear()
+    # The mystery-box draw pool is derived from the same tables.
+    invalidate_prize_pool_cache()
+
+
+# The path prefix every marketplace route below is registered under;
+# the error middleware only applies inside it.
+_API_PREFIX = '/rewards/api/v1/'
+
+
+@web.middleware
+async def marketplace_error_middleware(request: web.Request, handler):
+    """
+    Single error boundary for the marketplace endpoints.
+
+    Handlers run without per-method try/except wrappers: validation
+    failures and bad arguments map to 400, anything unexpected is logged
+    with its traceback and mapped to 500. aiohttp's own HTTP exceptions
+    pass through untouched. Requests outside the marketplace prefix are
+    passed straight through so the rest of the app keeps navigator's
+    error semantics.
+    """
+    if not request.path.startswith(_API_PREFIX):
+        return await handler(request)
+    try:
+        return await handler(request)
+    except web.HTTPException:
+        raise
+    except (ValidationError, fastjsonschema.JsonSchemaException) as err:
+        payload = getattr(err, 'payload', None) or str(err)
+        return web.json_response({'error': str(payload)}, status=400)
+    except (ValueError, TypeError) as err:
+        return web.json_response({'error': str(err)}, status=400)
+    except Exception as err:  # pylint: disable=W0703
+        _logger.exception(f"Unhandled error on {request.path}: {err}")
+        return web.json_response({'error': str(err)}, status=500)
+
+
+class ORJSONResponseMixin:
+    """
+    Serialize JSON responses with orjson instead of stdlib json.
+
+    orjson emits bytes directly with C-level number/string encoding and
+    handles datetime/UUID natively, which dominates on the large list
+    payloads these handlers return.
+    """
+
+    def json_response(
+        self,
+        response: dict = None,
+        reason: str = None,
+        headers: dict = None,
+        status: int = 200,
+        **kwargs
+    ):
+        """Return a JSON Web Response encoded with orjson."""
+        return web.Response(
+            body=orjson.dumps(response, default=_json_default),
+            content_type='application/json',
+            status=status,
+            reason=reason,
+            headers=headers
+        )
+
+    def _now(self) -> datetime:
+        """Timezone-aware audit timestamp, read once per request.
+
+        Naive ``datetime.now()`` stamps force Postgres to cast per row;
+        a single aware read also keeps every column written by one
+        request on exactly the same instant.
+        """
+        now = getattr(self, '_cached_now', None)
+        if now is None:
+            now = self._cached_now = datetime.now(timezone.utc)
+        return now
+
+
+class _ServiceMixin:
+    """Shared accessor for the app-scoped marketplace service."""
+
+    async def _get_service(self) -> MarketplaceService:
+        return self.request.app['marketplace_service']
+
+
+# Prepared statements keyed by the underlying asyncpg connection, so each
+# pooled connection parses/plans a given query exactly once for its
+# lifetime. WeakKeyDictionary lets entries vanish when the pool recycles
+# a connection.
+_stmt_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
+async def _prepared(driver, sql: str):
+    """Return a per-connection cached prepared statement for `sql`."""
+    try:
+        cache = _stmt_cache[driver]
+    except KeyError:
+        cache = _stmt_cache.setdefault(driver, {})
+    stmt = cache.get(sql)
+    if stmt is None:
+        stmt = cache[sql] = await driver.prepare(sql)
+    return stmt
 
-class PrizeCatalogHandler(BaseView):
+
+async def _stream_fetch(conn, sql: str, *args, chunk: int = 500):
+    """
+    Stream rows from a server-side cursor instead of fetching all at once.
+
+    Keeps memory bounded at O(chunk) for unbounded list queries: asyncpg
+    prefetches rows in fixed-size batches behind the scenes.
+    """
+    driver = conn.get_connection()
+    stmt = await _prepared(driver, sql)
+    async with driver.transaction():
+        async for row in stmt.cursor(*args, prefetch=chunk):
+            yield row
+
+
+async def stream_json_response(request, rows, content_type='application/json'):
+    """
+    Write an async iterable of rows as a chunked JSON array response.
+
+    Each row is serialized with orjson as it arrives, so N-row results
+    never materialize as a Python list.
+    """
+    response = web.StreamResponse(
+        status=200,
+        headers={'Content-Type': content_type}
+    )
+    await response.prepare(request)
+    await response.write(b'[')
+    first = True
+    async for row in rows:
+        if not first:
+            await response.write(b',')
+        await response.write(orjson.dumps(dict(row), default=str))
+        first = False
+    await response.write(b']')
+    await response.write_eof()
+    return response
+
+
+class PrizeCatalogHandler(ORJSONResponseMixin, _ServiceMixin, BaseView):
     """
     Handler for prize catalog operations.
 
@@ -46,132 +401,117 @@ class PrizeCatalogHandler(BaseView):
         """List prizes or get single prize."""
         prize_id = self.request.match_info.get('prize_id')
 
-        try:
-            service = await self._get_service()
-
-            if prize_id:
-                # Single prize
-                prize = await service.get_prize(int(prize_id))
-                if not prize:
-                    return self.not_found(
-                        message=f"Prize {prize_id} not found"
-                    )
-                return self.json_response(prize)
-            else:
-                # List with filters
-                params = self.request.rel_url.query
-
-                prizes = await service.get_catalog(
-                    category_id=params.get('category_id'),
-                    tier_id=params.get('tier_id'),
-                    is_active=params.get('is_active', 'true').lower() == 'true',
-                    is_featured=params.get('is_featured'),
-                    in_stock_only=params.get('in_stock_only', 'false').lower() == 'true',
-                    mystery_eligible_only=params.get('mystery_eligible', 'false').lower() == 'true',
-                    search_term=params.get('search'),
-                    limit=int(params.get('limit', 50)),
-                    offset=int(params.get('offset', 0))
-                )
-
-                return self.json_response({
-                    'prizes': prizes,
-                    'count': len(prizes)
-                })
+        service = await self._get_service()
 
-        except Exception as err:
-            return self.error(
-                message=f"Error fetching prizes: {err}",
-                status=500
-            )
+        if prize_id:
+            # Single prize
+            prize = await service.get_prize(int(prize_id))
+            if not prize:
+                return self.not_found(
+                    message=f"Prize {prize_id} not found"
+                )
+            return self.json_response(prize)
+
+        # List with filters
+        q = _parse_query(self.request.rel_url.query, _CATALOG_QUERY_SPEC)
+
+        cache_key = ('catalog',) + tuple(q.values())
+        cached = _cached_catalog_response(self.request, cache_key)
+        if cached is not None:
+            return cached
+
+        # Postgres aggregates and encodes the whole page server-side, so
+        # no per-row Python objects are built on the way out.
+        body = await service.get_catalog_json(
+            category_id=q['category_id'],
+            tier_id=q['tier_id'],
+            is_active=q['is_active'],
+            is_featured=q['is_featured'],
+            in_stock_only=q['in_stock_only'],
+            mystery_eligible_only=q['mystery_eligible'],
+            search_term=q['search'],
+            limit=q['limit'],
+            offset=q['offset'],
+            # ?after= takes precedence over offset: keyset paging costs
+            # the same for page 100 as for page 1.
+            after=decode_catalog_cursor(q['after']) if q['after'] else None
+        )
+        return _store_catalog_response(cache_key, body.encode('utf-8'))
 
     async def post(self):
         """Create a new prize (admin only)."""
-        try:
-            session = await self.get_session()
-            if not self._is_admin(session):
-                return self.not_authorized(
-                    message="Admin privileges required"
-                )
-
-            data = await self.request.json()
-            data['created_by'] = session.get('email')
+        # Session lookup and body parse touch independent IO (auth store
+        # vs. socket buffer), so overlap them instead of paying both waits.
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
+        if not _is_admin(session):
+            return self.not_authorized(
+                message="Admin privileges required"
+            )
 
-            prize = PrizeCatalog(**data)
-            result = await prize.insert()
+        # Compiled validator + direct INSERT: no per-request datamodel
+        # construction walking every field of the model.
+        PRIZE_VALIDATOR(data)
 
-            return self.json_response(
-                {'prize_id': result.prize_id, 'message': 'Prize created'},
-                status=201
-            )
+        service = await self._get_service()
+        prize_id = await service.create_prize(
+            data, created_by=session.get('email')
+        )
+        _invalidate_catalog_cache()
 
-        except ValidationError as err:
-            return self.error(message=str(err.payload), status=400)
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        return self.json_response(
+            {'prize_id': prize_id, 'message': 'Prize created'},
+            status=201
+        )
 
     async def put(self):
         """Update a prize (admin only)."""
         prize_id = self.request.match_info.get('prize_id')
 
-        try:
-            session = await self.get_session()
-            if not self._is_admin(session):
-                return self.not_authorized()
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
+        if not _is_admin(session):
+            return self.not_authorized()
 
-            data = await self.request.json()
-            data['updated_by'] = session.get('email')
-            data['updated_at'] = datetime.now()
-
-            prize = await PrizeCatalog.get(prize_id=int(prize_id))
-            if not prize:
-                return self.not_found()
+        # One UPDATE filtered by the model's column set: no SELECT, no
+        # setattr loop over the payload.
+        service = await self._get_service()
+        updated = await service.update_prize(
+            int(prize_id), data, updated_by=session.get('email')
+        )
+        if not updated:
+            return self.not_found()
 
-            for key, value in data.items():
-                if hasattr(prize, key):
-                    setattr(prize, key, value)
+        _invalidate_catalog_cache()
 
-            await prize.update()
-
-            return self.json_response({'message': 'Prize updated'})
-
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        return self.json_response({'message': 'Prize updated'})
 
     async def delete(self):
         """Soft delete a prize (admin only)."""
         prize_id = self.request.match_info.get('prize_id')
 
-        try:
-            session = await self.get_session()
-            if not self._is_admin(session):
-                return self.not_authorized()
-
-            prize = await PrizeCatalog.get(prize_id=int(prize_id))
-            if not prize:
-                return self.not_found()
-
-            prize.deleted_at = datetime.now()
-            prize.deleted_by = session.get('email')
-            prize.is_active = False
-            await prize.update()
+        session = await self.get_session()
+        if not _is_admin(session):
+            return self.not_authorized()
 
-            return self.json_response({'message': 'Prize deleted'})
+        prize = await PrizeCatalog.get(prize_id=int(prize_id))
+        if not prize:
+            return self.not_found()
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        prize.deleted_at = self._now()
+        prize.deleted_by = session.get('email')
+        prize.is_active = False
+        await prize.update()
+        _invalidate_catalog_cache()
+        service = await self._get_service()
+        service.schedule_catalog_refresh()
 
-    async def _get_service(self) -> MarketplaceService:
-        """Get the marketplace service."""
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
-
-    def _is_admin(self, session: dict) -> bool:
-        """Check if user has admin privileges."""
-        groups = session.get('groups', [])
-        return 'admin' in groups or 'rewards_admin' in groups
+        return self.json_response({'message': 'Prize deleted'})
 
 
-class PrizeAwardHandler(BaseView):
+class PrizeAwardHandler(ORJSONResponseMixin, _ServiceMixin, BaseView):
     """
     Handler for prize award operations.
 
@@ -183,95 +523,98 @@ class PrizeAwardHandler(BaseView):
 
     async def post(self):
         """Award a prize to a user."""
-        try:
-            session = await self.get_session()
-            data = await self.request.json()
-
-            # Validate required fields
-            required = ['prize_id', 'user_id', 'user_email']
-            for field in required:
-                if field not in data:
-                    return self.error(
-                        message=f"Missing required field: {field}",
-                        status=400
-                    )
-
-            service = await self._get_service()
-
-            result = await service.award_prize(
-                prize_id=data['prize_id'],
-                user_id=data['user_id'],
-                user_email=data['user_email'],
-                source=AwardSource(data.get('source', 'manual')),
-                source_reference_id=data.get('source_reference_id'),
-                source_reference_type=data.get('source_reference_type'),
-                linked_award_id=data.get('linked_award_id'),
-                awarded_by_user_id=session.get('user_id'),
-                awarded_by_email=session.get('email'),
-                award_message=data.get('message'),
-                expires_in_days=data.get('expires_in_days'),
-                metadata=data.get('metadata'),
-                user_employee_id=data.get('user_employee_id')
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
+
+        AWARD_VALIDATOR(data)
+
+        service = await self._get_service()
+
+        result = await service.award_prize(
+            prize_id=data['prize_id'],
+            user_id=data['user_id'],
+            user_email=data['user_email'],
+            source=_AWARD_SOURCES.get(
+                data.get('source', 'manual'), AwardSource.MANUAL
+            ),
+            source_reference_id=data.get('source_reference_id'),
+            source_reference_type=data.get('source_reference_type'),
+            linked_award_id=data.get('linked_award_id'),
+            awarded_by_user_id=session.get('user_id'),
+            awarded_by_email=session.get('email'),
+            award_message=data.get('message'),
+            expires_in_days=data.get('expires_in_days'),
+            metadata=data.get('metadata'),
+            user_employee_id=data.get('user_employee_id')
+        )
+
+        if result.success:
+            return self.json_response(
+                {
+                    'award_id': result.award_id,
+                    'message': result.message
+                },
+                status=201
             )
-
-            if result.success:
-                return self.json_response(
-                    {
-                        'award_id': result.award_id,
-                        'message': result.message
-                    },
-                    status=201
-                )
-            else:
-                return self.error(message=result.error, status=400)
-
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        return self.error(message=result.error, status=400)
 
     async def get(self):
         """Get award details or user's awards."""
         award_id = self.request.match_info.get('award_id')
         user_id = self.request.match_info.get('user_id')
 
-        try:
-            service = await self._get_service()
-
-            if award_id:
-                # Single award
-                award = await PrizeAward.get(award_id=int(award_id))
-                if not award:
-                    return self.not_found()
-                return self.json_response(award.to_dict())
-
-            elif user_id:
-                # User's wallet
-                params = self.request.rel_url.query
-                status_filter = params.get('status')
-
-                wallet = await service.get_user_wallet(
-                    user_id=int(user_id),
-                    status_filter=[status_filter] if status_filter else None,
-                    include_expired=params.get('include_expired', 'false').lower() == 'true'
-                )
+        service = await self._get_service()
 
-                stats = await service.get_user_wallet_stats(int(user_id))
+        if award_id:
+            # Single award, JSON-encoded by Postgres: no model
+            # hydration or per-field to_dict() walk on the read path.
+            body = await service.get_award_json(int(award_id))
+            if not body:
+                return self.not_found()
+            return web.Response(
+                body=body, content_type='application/json'
+            )
 
-                return self.json_response({
-                    'awards': wallet,
-                    'stats': stats
-                })
-            else:
-                return self.error(message="Award ID or User ID required", status=400)
+        if user_id:
+            # User's wallet
+            q = _parse_query(self.request.rel_url.query, _WALLET_QUERY_SPEC)
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+            # Wallet and stats come back in one round trip
+            wallet = await service.get_wallet_and_stats(
+                user_id=int(user_id),
+                status_filter=[q['status']] if q['status'] else None,
+                include_expired=q['include_expired']
+            )
 
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
+            return self.json_response(wallet)
+
+        return self.error(message="Award ID or User ID required", status=400)
+
+    async def post_bulk(self):
+        """Get the wallets of many users in one round trip (admin)."""
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
+        if not _is_admin(session):
+            return self.not_authorized()
 
+        user_ids = data.get('user_ids')
+        if not isinstance(user_ids, list) or not user_ids:
+            return self.error(message="user_ids is required", status=400)
 
-class PrizeRedemptionHandler(BaseView):
+        ids = [int(u) for u in user_ids]
+
+        service = await self._get_service()
+        wallets = await service.get_wallets_bulk(ids)
+
+        return self.json_response({
+            'wallets': {str(uid): wallets.get(uid, []) for uid in ids},
+            'count': len(ids)
+        })
+
+
+class PrizeRedemptionHandler(ORJSONResponseMixin, _ServiceMixin, BaseView):
     """
     Handler for prize redemption operations.
 
@@ -286,172 +629,138 @@ class PrizeRedemptionHandler(BaseView):
 
     async def post(self):
         """Initiate a new redemption."""
-        try:
-            session = await self.get_session()
-            data = await self.request.json()
-
-            if 'award_id' not in data:
-                return self.error(
-                    message="award_id is required",
-                    status=400
-                )
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
 
-            service = await self._get_service()
+        REDEMPTION_VALIDATOR(data)
 
-            result = await service.initiate_redemption(
-                award_id=data['award_id'],
-                user_id=session.get('user_id'),
-                fulfillment_method=data.get('fulfillment_method'),
-                shipping_address=data.get('shipping_address'),
-                metadata=data.get('metadata')
-            )
+        service = await self._get_service()
 
-            if result.success:
-                return self.json_response(
-                    {
-                        'redemption_id': result.redemption_id,
-                        'redemption_code': result.redemption_code,
-                        'message': result.message
-                    },
-                    status=201
-                )
-            else:
-                return self.error(message=result.error, status=400)
+        result = await service.initiate_redemption(
+            award_id=data['award_id'],
+            user_id=session.get('user_id'),
+            fulfillment_method=data.get('fulfillment_method'),
+            shipping_address=data.get('shipping_address'),
+            metadata=data.get('metadata')
+        )
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        if result.success:
+            return self.json_response(
+                {
+                    'redemption_id': result.redemption_id,
+                    'redemption_code': result.redemption_code,
+                    'message': result.message
+                },
+                status=201
+            )
+        return self.error(message=result.error, status=400)
 
     async def get(self):
         """Get redemption details."""
         redemption_id = self.request.match_info.get('redemption_id')
 
-        try:
-            redemption = await PrizeRedemption.get(
-                redemption_id=int(redemption_id)
-            )
-            if not redemption:
-                return self.not_found()
-
-            return self.json_response(redemption.to_dict())
+        service = await self._get_service()
+        body = await service.get_redemption_json(int(redemption_id))
+        if not body:
+            return self.not_found()
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        return web.Response(body=body, content_type='application/json')
 
     async def put_status(self):
         """Update redemption status (admin)."""
         redemption_id = self.request.match_info.get('redemption_id')
 
-        try:
-            session = await self.get_session()
-            data = await self.request.json()
-
-            if 'status' not in data:
-                return self.error(message="status is required", status=400)
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
 
-            service = await self._get_service()
+        new_status = _REDEMPTION_STATUSES.get(data.get('status'))
+        if new_status is None:
+            return self.error(message="a valid status is required", status=400)
 
-            result = await service.update_redemption_status(
-                redemption_id=int(redemption_id),
-                new_status=RedemptionStatus(data['status']),
-                updated_by_user_id=session.get('user_id'),
-                updated_by_email=session.get('email'),
-                reason=data.get('reason'),
-                fulfillment_details=data.get('fulfillment_details'),
-                tracking_number=data.get('tracking_number'),
-                admin_notes=data.get('admin_notes')
-            )
+        service = await self._get_service()
 
-            if result.success:
-                return self.json_response({'message': result.message})
-            else:
-                return self.error(message=result.error, status=400)
+        result = await service.update_redemption_status(
+            redemption_id=int(redemption_id),
+            new_status=new_status,
+            updated_by_user_id=session.get('user_id'),
+            updated_by_email=session.get('email'),
+            reason=data.get('reason'),
+            fulfillment_details=data.get('fulfillment_details'),
+            tracking_number=data.get('tracking_number'),
+            admin_notes=data.get('admin_notes')
+        )
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        if result.success:
+            return self.json_response({'message': result.message})
+        return self.error(message=result.error, status=400)
 
     async def post_cancel(self):
         """Cancel a redemption."""
         redemption_id = self.request.match_info.get('redemption_id')
 
-        try:
-            session = await self.get_session()
-            data = await self.request.json()
-
-            service = await self._get_service()
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
 
-            result = await service.cancel_redemption(
-                redemption_id=int(redemption_id),
-                cancelled_by_user_id=session.get('user_id'),
-                reason=data.get('reason', 'User cancelled')
-            )
+        service = await self._get_service()
 
-            if result.success:
-                return self.json_response({'message': 'Redemption cancelled'})
-            else:
-                return self.error(message=result.error, status=400)
+        result = await service.cancel_redemption(
+            redemption_id=int(redemption_id),
+            cancelled_by_user_id=session.get('user_id'),
+            reason=data.get('reason', 'User cancelled')
+        )
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        if result.success:
+            return self.json_response({'message': 'Redemption cancelled'})
+        return self.error(message=result.error, status=400)
 
     async def post_complete(self):
         """Complete a redemption (admin)."""
         redemption_id = self.request.match_info.get('redemption_id')
 
-        try:
-            session = await self.get_session()
-            data = await self.request.json()
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
 
-            service = await self._get_service()
+        service = await self._get_service()
 
-            result = await service.complete_redemption(
-                redemption_id=int(redemption_id),
-                fulfillment_details=data.get('fulfillment_details'),
-                completed_by_email=session.get('email')
-            )
-
-            if result.success:
-                return self.json_response({'message': 'Redemption completed'})
-            else:
-                return self.error(message=result.error, status=400)
+        result = await service.complete_redemption(
+            redemption_id=int(redemption_id),
+            fulfillment_details=data.get('fulfillment_details'),
+            completed_by_email=session.get('email')
+        )
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        if result.success:
+            return self.json_response({'message': 'Redemption completed'})
+        return self.error(message=result.error, status=400)
 
     async def post_feedback(self):
         """Submit feedback for a redemption."""
         redemption_id = self.request.match_info.get('redemption_id')
 
-        try:
-            data = await self.request.json()
-
-            redemption = await PrizeRedemption.get(
-                redemption_id=int(redemption_id)
-            )
-            if not redemption:
-                return self.not_found()
+        data = await _parse_body(self.request)
 
-            if redemption.status != RedemptionStatus.COMPLETED.value:
-                return self.error(
-                    message="Can only provide feedback for completed redemptions",
-                    status=400
-                )
+        service = await self._get_service()
 
-            redemption.user_rating = data.get('rating')
-            redemption.user_feedback = data.get('feedback')
-            redemption.feedback_at = datetime.now()
-            await redemption.update()
+        # Targeted UPDATE of the feedback columns only: a model-level
+        # update() would try to write the GENERATED metric columns too,
+        # which Postgres rejects on completed rows.
+        result = await service.submit_redemption_feedback(
+            redemption_id=int(redemption_id),
+            rating=data.get('rating'),
+            feedback=data.get('feedback')
+        )
 
-            return self.json_response({'message': 'Feedback submitted'})
+        if result.success:
+            return self.json_response({'message': result.message})
+        if result.error == "Redemption not found":
+            return self.not_found()
+        return self.error(message=result.error, status=400)
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
 
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
-
-
-class MysteryBoxHandler(BaseView):
+class MysteryBoxHandler(ORJSONResponseMixin, _ServiceMixin, BaseView):
     """
     Handler for mystery box operations.
 
@@ -463,92 +772,90 @@ class MysteryBoxHandler(BaseView):
 
     async def post_trigger(self):
         """Trigger a mystery box event (admin)."""
-        try:
-            session = await self.get_session()
-
-            if not self._is_admin(session):
-                return self.not_authorized()
-
-            data = await self.request.json()
-
-            service = await self._get_service()
-
-            result = await service.execute_mystery_box(
-                event_name=data.get('event_name', 'Manual Mystery Box'),
-                winner_count=data.get('winner_count', 1),
-                eligible_user_ids=data.get('eligible_user_ids'),
-                eligibility_criteria=data.get('eligibility_criteria'),
-                tier_overrides=data.get('tier_overrides'),
-                expires_in_days=data.get('expires_in_days', 30),
-                linked_reward_id=data.get('linked_reward_id'),
-                created_by=session.get('email')
-            )
-
-            if result.success:
-                return self.json_response({
-                    'event_id': result.event_id,
-                    'winners': result.winners,
-                    'total_prizes': result.total_prizes_awarded,
-                    'message': result.message
-                })
-            else:
-                return self.error(message=result.error, status=400)
-
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        session, data = await asyncio.gather(
+            self.get_session(), _parse_body(self.request)
+        )
+
+        if not _is_admin(session):
+            return self.not_authorized()
+
+        service = await self._get_service()
+
+        result = await service.execute_mystery_box(
+            event_name=data.get('event_name', 'Manual Mystery Box'),
+            winner_count=data.get('winner_count', 1),
+            eligible_user_ids=data.get('eligible_user_ids'),
+            eligibility_criteria=data.get('eligibility_criteria'),
+            tier_overrides=data.get('tier_overrides'),
+            expires_in_days=data.get('expires_in_days', 30),
+            linked_reward_id=data.get('linked_reward_id'),
+            created_by=session.get('email')
+        )
+
+        if result.success:
+            return self.json_response({
+                'event_id': result.event_id,
+                'winners': result.winners,
+                'total_prizes': result.total_prizes_awarded,
+                'message': result.message
+            })
+        return self.error(message=result.error, status=400)
 
     async def get_events(self):
         """List mystery box events."""
-        try:
-            params = self.request.rel_url.query
-            limit = int(params.get('limit', 20))
-            offset = int(params.get('offset', 0))
-            status = params.get('status')
-
-            db = self.request.app.get('database')
+        q = _parse_query(self.request.rel_url.query, _EVENTS_QUERY_SPEC)
+        limit = q['limit']
+        offset = q['offset']
+        status = q['status']
 
-            query = """
-                SELECT * FROM rewards.mystery_box_events
-                WHERE ($1::text IS NULL OR status = $1)
-                ORDER BY scheduled_at DESC
-                LIMIT $2 OFFSET $3
-            """
+        db = self.request.app.get('database')
 
+        if q['stream']:
+            # Unbounded export: stream from a server-side cursor so the
+            # full history never materializes in memory at once.
             async with await db.acquire() as conn:
-                results = await conn.fetch_all(query, [status, limit, offset])
-
-            return self.json_response({
-                'events': [dict(r) for r in results],
-                'count': len(results)
-            })
+                return await stream_json_response(
+                    self.request,
+                    _stream_fetch(conn, _EVENTS_STREAM_SQL, status)
+                )
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        # Emit the envelope incrementally from the cursor: rows go
+        # Record -> bytes with no intermediate list of dicts, so memory
+        # stays constant whatever the page size.
+        async with await db.acquire() as conn:
+            response = web.StreamResponse(
+                status=200,
+                headers={'Content-Type': 'application/json'}
+            )
+            await response.prepare(self.request)
+            await response.write(b'{"events":[')
+            count = 0
+            async for row in _stream_fetch(
+                conn, _EVENTS_PAGE_SQL, status, limit, offset
+            ):
+                if count:
+                    await response.write(b',')
+                await response.write(
+                    orjson.dumps(dict(row), default=_json_default)
+                )
+                count += 1
+            await response.write(b'],"count":%d}' % count)
+            await response.write_eof()
+            return response
 
     async def get_event(self):
         """Get mystery box event details."""
         event_id = self.request.match_info.get('event_id')
 
-        try:
-            event = await MysteryBoxEvent.get(event_id=int(event_id))
-            if not event:
-                return self.not_found()
-
-            return self.json_response(event.to_dict())
-
-        except Exception as err:
-            return self.error(message=str(err), status=500)
-
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
+        service = await self._get_service()
+        body = await service.get_event_json(int(event_id))
+        if not body:
+            return self.not_found()
 
-    def _is_admin(self, session: dict) -> bool:
-        groups = session.get('groups', [])
-        return 'admin' in groups or 'rewards_admin' in groups
+        return web.Response(body=body, content_type='application/json')
 
 
-class UserWalletHandler(BaseView):
+class UserWalletHandler(ORJSONResponseMixin, _ServiceMixin, BaseView):
     """
     Handler for user prize wallet.
 
@@ -559,122 +866,143 @@ class UserWalletHandler(BaseView):
 
     async def get_wallet(self):
         """Get current user's prize wallet."""
-        try:
-            session = await self.get_session()
-            user_id = session.get('user_id')
-
-            params = self.request.rel_url.query
+        session = await self.get_session()
+        user_id = session.get('user_id')
 
-            service = await self._get_service()
+        q = _parse_query(self.request.rel_url.query, _WALLET_QUERY_SPEC)
 
-            wallet = await service.get_user_wallet(
-                user_id=user_id,
-                status_filter=params.get('status'),
-                include_expired=params.get('include_expired', 'false').lower() == 'true'
-            )
+        service = await self._get_service()
 
-            return self.json_response({
-                'awards': wallet,
-                'count': len(wallet)
-            })
+        wallet = await service.get_user_wallet(
+            user_id=user_id,
+            status_filter=q['status'],
+            include_expired=q['include_expired']
+        )
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        return self.json_response({
+            'awards': [w.__values__ for w in wallet],
+            'count': len(wallet)
+        })
 
     async def get_stats(self):
         """Get wallet statistics."""
-        try:
-            session = await self.get_session()
-            user_id = session.get('user_id')
+        session = await self.get_session()
+        user_id = session.get('user_id')
 
-            service = await self._get_service()
-            stats = await service.get_user_wallet_stats(user_id)
+        service = await self._get_service()
+        stats = await service.get_user_wallet_stats(user_id)
 
-            return self.json_response(stats)
+        return self.json_response(stats)
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
 
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
+# Categories and tiers are read-only endpoints with no view state, so
+# they run as plain function handlers: no per-request BaseView
+# allocation, just the cache lookup and (on miss) one service call.
+async def list_prize_categories(request: web.Request):
+    """List prize categories."""
+    cached = _cached_catalog_response(request, ('categories',))
+    if cached is not None:
+        return cached
+    service = request.app['marketplace_service']
+    categories = await service.get_categories()
+    body = orjson.dumps({'categories': categories}, default=_json_default)
+    return _store_catalog_response(('categories',), body)
+
 
+async def list_prize_tiers(request: web.Request):
+    """List prize tiers."""
+    cached = _cached_catalog_response(request, ('tiers',))
+    if cached is not None:
+        return cached
+    service = request.app['marketplace_service']
+    tiers = await service.get_tiers()
+    body = orjson.dumps({'tiers': tiers}, default=_json_default)
+    return _store_catalog_response(('tiers',), body)
 
-class PrizeCategoryHandler(BaseView):
-    """Handler for prize categories."""
+
+class RedemptionMetricsHandler(ORJSONResponseMixin, _ServiceMixin, BaseView):
+    """Handler for redemption metrics and analytics."""
 
     async def get(self):
-        """List prize categories."""
-        try:
-            service = await self._get_service()
-            categories = await service.get_categories()
-            return self.json_response({'categories': categories})
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        """Get redemption metrics."""
+        params = self.request.rel_url.query
 
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
+        start_date = None
+        end_date = None
 
+        if params.get('start_date'):
+            start_date = datetime.fromisoformat(params['start_date'])
+        if params.get('end_date'):
+            end_date = datetime.fromisoformat(params['end_date'])
 
-class PrizeTierHandler(BaseView):
-    """Handler for prize tiers."""
+        service = await self._get_service()
+        metrics = await service.get_redemption_metrics(start_date, end_date)
 
-    async def get(self):
-        """List prize tiers."""
-        try:
-            service = await self._get_service()
-            tiers = await service.get_tiers()
-            return self.json_response({'tiers': tiers})
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+        return self.json_response(metrics)
 
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
+    async def get_popularity(self):
+        """Get prize popularity rankings."""
+        params = self.request.rel_url.query
+        limit = int(params.get('limit', 10))
 
+        service = await self._get_service()
+        popularity = await service.get_prize_popularity(limit)
 
-class RedemptionMetricsHandler(BaseView):
-    """Handler for redemption metrics and analytics."""
+        return self.json_response({'prizes': popularity})
 
-    async def get(self):
-        """Get redemption metrics."""
-        try:
-            params = self.request.rel_url.query
 
-            start_date = None
-            end_date = None
+# Sub-route dispatchers: instantiate the view per request, like aiohttp
+# does for class-based routes. Registering bound methods of a single
+# shared instance (Handler().method) would leak state across requests.
+async def _redemption_status(request: web.Request):
+    return await PrizeRedemptionHandler(request).put_status()
 
-            if params.get('start_date'):
-                start_date = datetime.fromisoformat(params['start_date'])
-            if params.get('end_date'):
-                end_date = datetime.fromisoformat(params['end_date'])
 
-            service = await self._get_service()
-            metrics = await service.get_redemption_metrics(start_date, end_date)
+async def _redemption_cancel(request: web.Request):
+    return await PrizeRedemptionHandler(request).post_cancel()
 
-            return self.json_response(metrics)
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+async def _redemption_complete(request: web.Request):
+    return await PrizeRedemptionHandler(request).post_complete()
 
-    async def get_popularity(self):
-        """Get prize popularity rankings."""
-        try:
-            params = self.request.rel_url.query
-            limit = int(params.get('limit', 10))
 
-            service = await self._get_service()
-            popularity = await service.get_prize_popularity(limit)
+async def _redemption_feedback(request: web.Request):
+    return await PrizeRedemptionHandler(request).post_feedback()
 
-            return self.json_response({'prizes': popularity})
 
-        except Exception as err:
-            return self.error(message=str(err), status=500)
+async def _awards_bulk(request: web.Request):
+    return await PrizeAwardHandler(request).post_bulk()
 
-    async def _get_service(self) -> MarketplaceService:
-        db = self.request.app.get('database')
-        return MarketplaceService(connection=db)
+
+async def _user_wallet(request: web.Request):
+    return await UserWalletHandler(request).get_wallet()
+
+
+async def _user_wallet_stats(request: web.Request):
+    return await UserWalletHandler(request).get_stats()
+
+
+async def _mystery_box_trigger(request: web.Request):
+    return await MysteryBoxHandler(request).post_trigger()
+
+
+async def _mystery_box_events(request: web.Request):
+    return await MysteryBoxHandler(request).get_events()
+
+
+async def _mystery_box_event(request: web.Request):
+    return await MysteryBoxHandler(request).get_event()
+
+
+async def _prize_popularity(request: web.Request):
+    return await RedemptionMetricsHandler(request).get_popularity()
+
+
+async def _setup_marketplace_service(app: web.Application):
+    """Create the app-scoped marketplace service once at startup."""
+    app['marketplace_service'] = MarketplaceService(
+        connection=app.get('database')
+    )
 
 
 def setup_marketplace_routes(app: web.Application):
@@ -685,6 +1013,15 @@ def setup_marketplace_routes(app: web.Application):
         from rewards.marketplace.handlers import setup_marketplace_routes
         setup_marketplace_routes(app)
     """
+    # Shared service instance: handlers fetch it from the app instead of
+    # allocating a MarketplaceService per request.
+    app.on_startup.append(_setup_marketplace_service)
+
+    # One error boundary for every endpoint below, instead of a
+    # try/except wrapper in each handler method. The middleware is
+    # app-wide by aiohttp's design but no-ops outside _API_PREFIX.
+    app.middlewares.append(marketplace_error_middleware)
+
     # Prize Catalog
     app.router.add_get(
         '/rewards/api/v1/prizes',
@@ -710,11 +1047,11 @@ def setup_marketplace_routes(app: web.Application):
     # Categories & Tiers
     app.router.add_get(
         '/rewards/api/v1/prize-categories',
-        PrizeCategoryHandler
+        list_prize_categories
     )
     app.router.add_get(
         '/rewards/api/v1/prize-tiers',
-        PrizeTierHandler
+        list_prize_tiers
     )
 
     # Awards
@@ -722,6 +1059,10 @@ def setup_marketplace_routes(app: web.Application):
         '/rewards/api/v1/awards',
         PrizeAwardHandler
     )
+    app.router.add_post(
+        '/rewards/api/v1/awards/bulk',
+        _awards_bulk
+    )
     app.router.add_get(
         '/rewards/api/v1/awards/{award_id}',
         PrizeAwardHandler
@@ -742,43 +1083,43 @@ def setup_marketplace_routes(app: web.Application):
     )
     app.router.add_put(
         '/rewards/api/v1/redemptions/{redemption_id}/status',
-        PrizeRedemptionHandler().put_status
+        _redemption_status
     )
     app.router.add_post(
         '/rewards/api/v1/redemptions/{redemption_id}/cancel',
-        PrizeRedemptionHandler().post_cancel
+        _redemption_cancel
     )
     app.router.add_post(
         '/rewards/api/v1/redemptions/{redemption_id}/complete',
-        PrizeRedemptionHandler().post_complete
+        _redemption_complete
     )
     app.router.add_post(
         '/rewards/api/v1/redemptions/{redemption_id}/feedback',
-        PrizeRedemptionHandler().post_feedback
+        _redemption_feedback
     )
 
     # User Wallet
     app.router.add_get(
         '/rewards/api/v1/wallet',
-        UserWalletHandler().get_wallet
+        _user_wallet
     )
     app.router.add_get(
         '/rewards/api/v1/wallet/stats',
-        UserWalletHandler().get_stats
+        _user_wallet_stats
     )
 
     # Mystery Box
     app.router.add_post(
         '/rewards/api/v1/mystery-box/trigger',
-        MysteryBoxHandler().post_trigger
+        _mystery_box_trigger
     )
     app.router.add_get(
         '/rewards/api/v1/mystery-box/events',
-        MysteryBoxHandler().get_events
+        _mystery_box_events
     )
     app.router.add_get(
         '/rewards/api/v1/mystery-box/events/{event_id}',
-        MysteryBoxHandler().get_event
+        _mystery_box_event
     )
 
     # Metrics
@@ -788,5 +1129,5 @@ def setup_marketplace_routes(app: web.Application):
     )
     app.router.add_get(
         '/rewards/api/v1/metrics/popularity',
-        RedemptionMetricsHandler().get_popularity
+        _prize_popularity
     )
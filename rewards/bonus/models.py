@@ -12,6 +12,7 @@ from enum import Enum
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
+import orjson
 from datamodel import BaseModel, Field
 from asyncdb.models import Model
 
@@ -112,12 +113,12 @@ class PrizeCategory(Model):
     )
     created_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         readonly=True
     )
     updated_at: datetime = Field(
         required=False,
-        default=datetime.now
+        db_default="now()"
     )
 
     class Meta:
@@ -168,7 +169,7 @@ class PrizeTier(Model):
     )
     created_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         readonly=True
     )
 
@@ -376,11 +377,11 @@ class PrizeCatalog(Model):
     # Audit
     created_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         readonly=True
     )
     created_by: Optional[str] = Field(required=False, readonly=True)
-    updated_at: datetime = Field(required=False, default=datetime.now)
+    updated_at: datetime = Field(required=False, db_default="now()")
     updated_by: Optional[str] = Field(required=False)
     deleted_at: Optional[datetime] = Field(required=False, readonly=True)
     deleted_by: Optional[str] = Field(required=False, readonly=True)
@@ -482,7 +483,7 @@ class PrizeAward(Model):
     awarded_by_email: Optional[str] = Field(required=False)
     awarded_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         label="Awarded At"
     )
     award_message: Optional[str] = Field(
@@ -499,7 +500,7 @@ class PrizeAward(Model):
     )
     status_changed_at: datetime = Field(
         required=False,
-        default=datetime.now
+        db_default="now()"
     )
     status_changed_by: Optional[str] = Field(required=False)
 
@@ -530,12 +531,12 @@ class PrizeAward(Model):
     # Audit
     created_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         readonly=True
     )
     updated_at: datetime = Field(
         required=False,
-        default=datetime.now
+        db_default="now()"
     )
 
     class Meta:
@@ -545,19 +546,24 @@ class PrizeAward(Model):
         endpoint = "rewards/api/v1/prize_awards"
         strict = True
 
-    def can_redeem(self) -> bool:
-        """Check if this award can be redeemed."""
+    def can_redeem(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if this award can be redeemed.
+
+        Callers iterating many awards should hoist ``now`` once per
+        batch instead of paying a datetime.now() per row.
+        """
         if self.status != AwardStatus.AVAILABLE.value:
             return False
-        if self.expires_at and self.expires_at < datetime.now():
+        if self.expires_at and self.expires_at < (now or datetime.now()):
             return False
         return True
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if the award has expired."""
         if self.expires_at is None:
             return False
-        return self.expires_at < datetime.now()
+        return self.expires_at < (now or datetime.now())
 
 
 # ============================================================================
@@ -616,7 +622,7 @@ class PrizeRedemption(Model):
     # Timestamps
     initiated_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         label="Initiated At"
     )
     approved_at: Optional[datetime] = Field(required=False, label="Approved At")
@@ -694,10 +700,10 @@ class PrizeRedemption(Model):
     # Audit
     created_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         readonly=True
     )
-    updated_at: datetime = Field(required=False, default=datetime.now)
+    updated_at: datetime = Field(required=False, db_default="now()")
 
     class Meta:
         driver = "pg"
@@ -728,7 +734,7 @@ class RedemptionStatusHistory(Model):
     new_status: str = Field(required=True)
     changed_at: datetime = Field(
         required=False,
-        default=datetime.now
+        db_default="now()"
     )
     changed_by_user_id: Optional[int] = Field(required=False)
     changed_by_email: Optional[str] = Field(required=False)
@@ -821,7 +827,7 @@ class MysteryBoxEvent(Model):
     # Audit
     created_at: datetime = Field(
         required=False,
-        default=datetime.now,
+        db_default="now()",
         readonly=True
     )
     created_by: Optional[str] = Field(required=False)
@@ -837,6 +843,56 @@ class MysteryBoxEvent(Model):
 # ============================================================================
 # VIEW MODELS (Read-only for API responses)
 # ============================================================================
+#
+# Trust boundary: view models are populated exclusively from rows that
+# PostgreSQL itself assembled (views and joins the application owns), so
+# from_row skips datamodel's per-field validation and coercion entirely.
+# Validation stays at API ingress, where payloads are untrusted.
+#
+# On memory: datamodel's metaclass declares __slots__ on model classes,
+# but by metaclass time instances already carry __dict__, so true
+# slotted (dict-less) instances are not achievable here. Bulk paths
+# avoid the cost differently: list/metrics queries return plain dict
+# rows or server-encoded JSON, and anything that does need typed rows
+# goes through from_row, which fills one shared-shape dict per
+# instance instead of running per-field __init__ machinery.
+
+_VIEW_DEFAULTS: Dict[type, Dict[str, Any]] = {}
+
+
+def view_from_row(model, row) -> BaseModel:
+    """Build a read-only view model from a trusted DB row, unvalidated.
+
+    Bypasses the generated __init__ (and its per-field type coercion)
+    by filling the instance dict directly, which is what dominates CPU
+    when list endpoints fan out thousands of rows.
+    """
+    try:
+        defaults = _VIEW_DEFAULTS[model]
+    except KeyError:
+        defaults = _VIEW_DEFAULTS[model] = {
+            name: (f.default() if callable(f.default) else f.default)
+            for name, f in model.get_columns().items()
+        }
+    obj = model.__new__(model)
+    values = {**defaults, **dict(row)}
+    obj.__dict__.update(values)
+    obj.__dict__['__values__'] = values
+    return obj
+
+
+def serialize_views(views: List[BaseModel]) -> bytes:
+    """Encode a list of view models straight to JSON bytes.
+
+    Reads each instance's row values as filled by view_from_row and
+    hands them to orjson in one C-level pass, so a thousand-row wallet
+    response never walks model fields in Python.
+    """
+    return orjson.dumps(
+        [v.__dict__.get('__values__') or v.to_dict() for v in views],
+        default=str
+    )
+
 
 class UserPrizeWallet(BaseModel):
     """
@@ -915,3 +971,10 @@ class RedemptionMetrics(BaseModel):
     seconds_to_initiate: Optional[int]
     seconds_to_complete: Optional[int]
     total_lifecycle_seconds: Optional[int]
+
+
+# Attached outside the class bodies so the model metaclass doesn't
+# treat the callable as a column definition.
+UserPrizeWallet.from_row = classmethod(view_from_row)
+PrizeCatalogView.from_row = classmethod(view_from_row)
+RedemptionMetrics.from_row = classmethod(view_from_row)
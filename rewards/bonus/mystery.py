@@ -39,6 +39,7 @@ Usage in rewards.json:
 }
 """
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from decimal import Decimal
 import random
@@ -46,6 +47,12 @@ import asyncio
 
 from navconfig.logging import logging
 
+try:
+    from asyncpg.exceptions import PostgresConnectionError, PostgresError
+except ImportError:
+    PostgresConnectionError = ConnectionError
+    PostgresError = ConnectionError
+
 if TYPE_CHECKING:
     from ..rewards.base import EvalContext, Environment
     from ..models import RewardView
@@ -88,6 +95,12 @@ class MysteryBoxRule:
         self.eligibility = eligibility or {}
         self.prize_pool_filter = prize_pool_filter or {}
         self.logger = logging.getLogger('Rewards.MysteryBox')
+        # tier_boost never changes after construction, so the int/float
+        # normalization happens once here instead of on every tick.
+        self._tier_rates = {
+            int(tier_id): float(boost)
+            for tier_id, boost in self.tier_boost.items()
+        }
 
     async def evaluate(
         self,
@@ -103,7 +116,8 @@ class MysteryBoxRule:
         try:
             service = MarketplaceService(
                 connection=env.connection,
-                logger=self.logger
+                logger=self.logger,
+                cache=getattr(env, 'cache', None)
             )
 
             # Execute mystery box
@@ -119,27 +133,54 @@ class MysteryBoxRule:
 
             if result.success:
                 self.logger.info(
-                    f"Mystery Box Event completed: {result.total_prizes_awarded} prizes awarded"
+                    "Mystery Box Event completed: %d prizes awarded",
+                    result.total_prizes_awarded
                 )
                 return result.winners
             else:
-                self.logger.error(f"Mystery Box Event failed: {result.error}")
+                self.logger.error("Mystery Box Event failed: %s", result.error)
                 return []
 
         except Exception as err:
-            self.logger.error(f"Error in MysteryBoxRule evaluation: {err}")
+            self.logger.error("Error in MysteryBoxRule evaluation: %s", err)
             return []
 
     def _calculate_tier_rates(self) -> Dict[int, float]:
-        """Apply tier boosts to base drop rates."""
-        if not self.tier_boost:
-            return {}
-
-        # Convert boost values to proper decimal rates
-        return {
-            int(tier_id): float(boost)
-            for tier_id, boost in self.tier_boost.items()
-        }
+        """Return the tier boost rates normalized at construction."""
+        return self._tier_rates
+
+
+# Parsed-rule cache: rewards.json reloads rebuild MysteryBoxReward
+# instances with the same parameters, so equal rule configs share one
+# MysteryBoxRule (the rule itself holds no per-event state).
+_RULE_CACHE: Dict[tuple, MysteryBoxRule] = {}
+
+
+def _freeze(value):
+    """Recursively convert dicts/lists into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _mystery_rule_for(rules: List[Any]) -> MysteryBoxRule:
+    """Return a (cached) MysteryBoxRule parsed from a reward's rule list."""
+    for rule in rules:
+        if isinstance(rule, (list, tuple)) and len(rule) >= 2:
+            rule_name, rule_params = rule[0], rule[1]
+            if rule_name == 'MysteryBoxRule':
+                try:
+                    key = _freeze(rule_params)
+                    cached = _RULE_CACHE.get(key)
+                    if cached is None:
+                        cached = _RULE_CACHE[key] = MysteryBoxRule(**rule_params)
+                    return cached
+                except TypeError:
+                    # Unhashable parameter value; build without caching.
+                    return MysteryBoxRule(**rule_params)
+    return MysteryBoxRule()  # Default
 
 
 class MysteryBoxReward:
@@ -168,12 +209,7 @@ class MysteryBoxReward:
 
     def _parse_mystery_rule(self) -> Optional[MysteryBoxRule]:
         """Parse the MysteryBoxRule from rules list."""
-        for rule in self._rules:
-            if isinstance(rule, (list, tuple)) and len(rule) >= 2:
-                rule_name, rule_params = rule[0], rule[1]
-                if rule_name == 'MysteryBoxRule':
-                    return MysteryBoxRule(**rule_params)
-        return MysteryBoxRule()  # Default
+        return _mystery_rule_for(self._rules)
 
     @property
     def reward_type(self) -> str:
@@ -199,7 +235,7 @@ class MysteryBoxReward:
         This is called by the scheduler at configured intervals.
         """
         self.logger.info(
-            f"Executing Mystery Box: {self._reward.reward}"
+            "Executing Mystery Box: %s", self._reward.reward
         )
 
         # Create environment if not provided
@@ -221,7 +257,7 @@ class MysteryBoxReward:
             return winners
 
         except Exception as err:
-            self.logger.error(f"Error executing mystery box: {err}")
+            self.logger.error("Error executing mystery box: %s", err)
             return []
 
     async def _notify_winners(
@@ -238,8 +274,11 @@ class MysteryBoxReward:
             if notifier_config:
                 notifier = TeamsWebhookNotifier(**notifier_config)
 
-                for winner in winners:
-                    await notifier.send_notification(
+                # Fire all webhook POSTs concurrently: total latency is
+                # one round-trip instead of one per winner, and a single
+                # failed send no longer blocks the rest.
+                results = await asyncio.gather(*[
+                    notifier.send_notification(
                         title="🎁 Mystery Box Winner!",
                         message=(
                             f"Congratulations! You've won a **{winner['tier']}** prize: "
@@ -248,15 +287,57 @@ class MysteryBoxReward:
                         ),
                         recipient_email=winner['user_email']
                     )
+                    for winner in winners
+                ], return_exceptions=True)
+
+                for winner, result in zip(winners, results):
+                    if isinstance(result, Exception):
+                        self.logger.warning(
+                            "Failed to notify %s: %s", winner['user_email'], result
+                        )
 
         except Exception as err:
-            self.logger.warning(f"Failed to send winner notifications: {err}")
+            self.logger.warning("Failed to send winner notifications: %s", err)
 
 
 # ============================================================================
 # SCHEDULER INTEGRATION
 # ============================================================================
 
+# Hoisted: getLogger is memoized but still takes the logging module
+# lock; the scheduler exercises these names on every fire.
+_MYSTERY_LOGGER = logging.getLogger('Rewards.MysteryBoxScheduler')
+_EXPIRE_LOGGER = logging.getLogger('Rewards.PrizeExpiration')
+
+
+def _get_marketplace_service(app) -> MarketplaceService:
+    """
+    Return the app-wide marketplace service shared by scheduled jobs.
+
+    Built lazily on first fire and kept for the app lifetime, so the
+    scheduler hot path reuses one service (and its prepared-statement /
+    pool state) instead of constructing a fresh instance per tick. No
+    lock needed: jobs run on the single event loop and construction is
+    idempotent.
+    """
+    service = app.get('_mystery_box_service')
+    if service is None:
+        # app['database'] is the application-wide AsyncPool (10-50
+        # connections, see app.py); every service query acquires from it,
+        # so concurrent workers never serialize on one connection.
+        db = app.get('database')
+        if db is not None and not hasattr(db, 'acquire'):
+            raise RuntimeError(
+                "app['database'] must be a connection pool, "
+                f"got {type(db).__name__}"
+            )
+        service = app['_mystery_box_service'] = MarketplaceService(
+            connection=db,
+            logger=logging.getLogger('Rewards.MysteryBox'),
+            cache=app.get('cache')
+        )
+    return service
+
 async def random_mystery_box_event(app, config: Dict[str, Any] = None):
     """
     Scheduled job function for mystery box events.
@@ -281,34 +362,123 @@ async def random_mystery_box_event(app, config: Dict[str, Any] = None):
             - expires_in_days: Prize expiration
             - eligibility: Eligibility criteria
     """
-    logger = logging.getLogger('Rewards.MysteryBoxScheduler')
+    # The scheduler tick only enqueues; the worker pool below executes.
+    # A stalled DB call therefore never delays the scheduler's next
+    # wakeup or the other registered jobs.  The fixed worker pool also
+    # caps fan-out, which a create_task-per-fire pattern would need a
+    # separate tracking set and semaphore to achieve.
+    queue = _ensure_mystery_box_workers(app)
+    await queue.put(config or {})
 
-    config = config or {}
 
-    try:
-        db = app.get('database')
-        service = MarketplaceService(connection=db, logger=logger)
-
-        result = await service.execute_mystery_box(
-            event_name=config.get('event_name', 'Scheduled Mystery Box'),
-            winner_count=config.get('winner_count', 1),
-            eligibility_criteria=config.get('eligibility'),
-            tier_overrides=config.get('tier_overrides'),
-            expires_in_days=config.get('expires_in_days', 30),
-            linked_reward_id=config.get('linked_reward_id'),
-            created_by='scheduler'
-        )
+# Bounds concurrent event executions when several fires queue up; the
+# pool drains them in parallel without swamping the connection pool.
+_WORKER_COUNT = 4
+
+
+def _ensure_mystery_box_workers(app) -> asyncio.Queue:
+    """Lazily start the mystery-box worker pool on the running loop."""
+    queue = app.get('_mystery_box_queue')
+    if queue is None:
+        queue = app['_mystery_box_queue'] = asyncio.Queue()
+        app['_mystery_box_workers'] = [
+            asyncio.create_task(_mystery_box_worker(app))
+            for _ in range(_WORKER_COUNT)
+        ]
+    return queue
+
 
-        if result.success:
-            logger.info(
-                f"Scheduled Mystery Box completed: "
-                f"{result.total_prizes_awarded} prizes to {len(result.winners)} winners"
+async def _expire_pool(app):
+    """Evict pooled connections after a connection-level failure.
+
+    Otherwise every subsequent fire re-draws the same half-open
+    connection from the pool and times out again.
+    """
+    pool = getattr(app.get('database'), '_pool', None)
+    expire = getattr(pool, 'expire_connections', None)
+    if expire is None:
+        return
+    try:
+        # asyncpg's expire_connections() is synchronous (it just bumps
+        # the pool generation); await only if a driver returns a coro.
+        result = expire()
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as err:  # pylint: disable=W0703
+        _MYSTERY_LOGGER.warning("Pool expiration failed: %s", err)
+
+
+async def _mystery_box_worker(app):
+    """Drain queued mystery-box configs and execute them."""
+    queue = app['_mystery_box_queue']
+    while True:
+        config = await queue.get()
+        # CancelledError stays uncaught so worker shutdown propagates;
+        # everything else is logged because a raise here would kill the
+        # worker task for the app's lifetime.
+        try:
+            await _execute_scheduled_event(app, config)
+        except PostgresConnectionError as err:
+            _MYSTERY_LOGGER.error(
+                "Connection error in scheduled mystery box: %s", err
+            )
+            await _expire_pool(app)
+        except PostgresError as err:
+            _MYSTERY_LOGGER.error(
+                "Database error in scheduled mystery box: %s", err
             )
-        else:
-            logger.error(f"Scheduled Mystery Box failed: {result.error}")
+        except Exception as err:  # pylint: disable=W0703
+            _MYSTERY_LOGGER.error("Error in scheduled mystery box: %s", err)
+        finally:
+            queue.task_done()
+
+
+async def _pool_healthy(app, timeout: float = 1.0) -> bool:
+    """Probe the pool with a bounded SELECT 1 before a scheduled fire.
+
+    A half-open pool otherwise makes the fire wait out the full command
+    timeout before failing; a one-second probe lets the job skip this
+    fire and try again on the next tick.
+    """
+    db = app.get('database')
+    if db is None:
+        return True
+    try:
+        await asyncio.wait_for(db.execute('SELECT 1'), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        _MYSTERY_LOGGER.warning("DB health probe timed out after %.1fs", timeout)
+    except Exception as err:  # pylint: disable=W0703
+        _MYSTERY_LOGGER.warning("DB health probe failed: %s", err)
+    return False
+
+
+async def _execute_scheduled_event(app, config: Dict[str, Any]):
+    """Run one scheduled mystery box event."""
+    if not await _pool_healthy(app):
+        return
+
+    service = _get_marketplace_service(app)
+
+    result = await service.execute_mystery_box(
+        event_name=config.get('event_name', 'Scheduled Mystery Box'),
+        winner_count=config.get('winner_count', 1),
+        eligibility_criteria=config.get('eligibility'),
+        tier_overrides=config.get('tier_overrides'),
+        expires_in_days=config.get('expires_in_days', 30),
+        linked_reward_id=config.get('linked_reward_id'),
+        created_by='scheduler'
+    )
 
-    except Exception as err:
-        logger.error(f"Error in scheduled mystery box: {err}")
+    if result.success:
+        # %-style args defer formatting until after level filtering, so
+        # the explicit isEnabledFor() guard is no longer needed.
+        _MYSTERY_LOGGER.info(
+            "Scheduled Mystery Box completed: %d prizes to %d winners",
+            result.total_prizes_awarded, len(result.winners)
+        )
+    else:
+        _MYSTERY_LOGGER.error("Scheduled Mystery Box failed: %s", result.error)
 
 
 async def expire_old_prizes(app):
@@ -317,19 +487,78 @@ async def expire_old_prizes(app):
 
     Should be run daily.
     """
-    logger = logging.getLogger('Rewards.PrizeExpiration')
-
     try:
-        db = app.get('database')
-        service = MarketplaceService(connection=db, logger=logger)
+        service = _get_marketplace_service(app)
 
-        expired_count = await service.expire_old_awards()
+        # Bound background DB pressure: maintenance jobs share this
+        # semaphore so they can never drain the pool away from
+        # user-facing handlers.
+        sem = app.get('_db_sem')
+        if sem is None:
+            sem = app['_db_sem'] = asyncio.Semaphore(4)
 
-        if expired_count > 0:
-            logger.info(f"Expired {expired_count} old prize awards")
+        async with sem:
+            expired_count = await service.expire_old_awards(batch_size=1000)
 
-    except Exception as err:
-        logger.error(f"Error expiring prizes: {err}")
+        if expired_count > 0:
+            _EXPIRE_LOGGER.info("Expired %d old prize awards", expired_count)
+
+    except PostgresConnectionError as err:
+        _EXPIRE_LOGGER.error("Connection error expiring prizes: %s", err)
+        await _expire_pool(app)
+    except PostgresError as err:
+        _EXPIRE_LOGGER.error("Database error expiring prizes: %s", err)
+    except Exception as err:  # pylint: disable=W0703
+        # Non-database failures are unexpected here; re-raise so the
+        # scheduler records the job as errored instead of hiding it.
+        _EXPIRE_LOGGER.error("Error expiring prizes: %s", err)
+        raise
+
+
+# Trigger cache, keyed by timezone: hot-reloads re-call
+# register_mystery_box_jobs, and cron field parsing (regex + range
+# validation) is the expensive part of building a CronTrigger.  The
+# triggers cannot be plain import-time constants because the timezone
+# is only known at registration, so they are memoized per timezone
+# instead.  CronTrigger instances are stateless between jobs, so
+# sharing one across registrations is safe.
+_TRIGGER_CACHE: Dict[str, tuple] = {}
+
+# Frozen once with Decimal rates so every lunch fire reuses the same
+# mapping and the service skips the per-fire float->Decimal conversion.
+_LUNCH_TIER_OVERRIDES = MappingProxyType({
+    5: Decimal('0.08'),
+    4: Decimal('0.15'),
+})
+
+
+def _cron_triggers(timezone=None) -> tuple:
+    """Return the (workday, expiration, lunch) CronTriggers for a timezone."""
+    from apscheduler.triggers.cron import CronTrigger
+
+    key = str(timezone)
+    triggers = _TRIGGER_CACHE.get(key)
+    if triggers is None:
+        triggers = (
+            CronTrigger(
+                minute='0,30',
+                hour='9-17',
+                day_of_week='mon-fri',
+                timezone=timezone,
+                # Other system jobs also align on :00/:30; spreading the
+                # fire across ±60s keeps the pool-acquire spike flat.
+                jitter=60
+            ),
+            CronTrigger(hour=2, timezone=timezone),  # 2 AM
+            CronTrigger(
+                hour=12,
+                minute=0,
+                day_of_week='mon-fri',
+                timezone=timezone
+            ),
+        )
+        _TRIGGER_CACHE[key] = triggers
+    return triggers
 
 
 def register_mystery_box_jobs(scheduler, app, timezone=None):
@@ -344,16 +573,23 @@ def register_mystery_box_jobs(scheduler, app, timezone=None):
         scheduler: APScheduler instance
         app: aiohttp application
         timezone: Timezone for job scheduling
+
+    Note:
+        The scheduled jobs are pure asyncio I/O, so their latency
+        characteristics assume the app runs on uvloop. The service
+        already depends on ``navigator-api[uvloop]``, which installs
+        uvloop as the event loop policy at startup; no per-module
+        setup is needed here.
     """
-    from datetime import timedelta
+    # APScheduler stores each job's precomputed next fire time, so the
+    # scheduler wakeup itself is a timestamp comparison either way; an
+    # interval trigger would drift off the :00/:30 alignment.
+    workday_trigger, expiration_trigger, lunch_trigger = _cron_triggers(timezone)
 
     # Workday mystery box events (every 30 min during work hours)
     scheduler.add_job(
         random_mystery_box_event,
-        'cron',
-        minute='0,30',
-        hour='9-17',
-        day_of_week='mon-fri',
+        workday_trigger,
         args=[app],
         kwargs={
             'config': {
@@ -365,42 +601,46 @@ def register_mystery_box_jobs(scheduler, app, timezone=None):
         id='mystery_box_workday',
         name='Workday Mystery Box (Every 30min)',
         replace_existing=True,
-        timezone=timezone,
-        misfire_grace_time=60
+        misfire_grace_time=60,
+        coalesce=True,
+        max_instances=1
     )
 
     # Daily prize expiration check
     scheduler.add_job(
         expire_old_prizes,
-        'cron',
-        hour=2,  # 2 AM
+        expiration_trigger,
         args=[app],
         id='prize_expiration_check',
         name='Daily Prize Expiration',
         replace_existing=True,
-        timezone=timezone
+        # Expiration must never be silently dropped: run it whenever the
+        # scheduler catches up, however late, but only once per backlog.
+        misfire_grace_time=None,
+        coalesce=True,
+        max_instances=1
     )
 
     # Optional: Lunch time special (higher legendary rate)
     scheduler.add_job(
         random_mystery_box_event,
-        'cron',
-        hour=12,
-        minute=0,
-        day_of_week='mon-fri',
+        lunch_trigger,
         args=[app],
         kwargs={
             'config': {
                 'event_name': 'Lunch Special Mystery Box',
                 'winner_count': 3,
                 'expires_in_days': 30,
-                'tier_overrides': {5: 0.08, 4: 0.15}  # Boosted rare drops
+                'tier_overrides': _LUNCH_TIER_OVERRIDES  # Boosted rare drops
             }
         },
         id='mystery_box_lunch_special',
         name='Lunch Special Mystery Box',
         replace_existing=True,
-        timezone=timezone
+        # A lunch event fired a few minutes late is still worth running.
+        misfire_grace_time=300,
+        coalesce=True,
+        max_instances=1
     )
 
 
@@ -408,137 +648,23 @@ def register_mystery_box_jobs(scheduler, app, timezone=None):
 # JSON CONFIGURATION EXAMPLES
 # ============================================================================
 
-MYSTERY_BOX_EXAMPLES = """
-# Example Mystery Box Configurations for rewards.json
+def get_examples_bytes() -> bytes:
+    """Return the example Mystery Box configurations as raw bytes.
 
-## Basic Mystery Box (runs every 30 min during work hours)
-{
-    "reward_id": 9000,
-    "reward": "Workday Mystery Box",
-    "description": "Random prizes awarded throughout the workday!",
-    "points": 0,
-    "reward_type": "Computed Badge",
-    "reward_category": "Mystery Box",
-    "reward_group": "Engagement",
-    "multiple": true,
-    "rules": [
-        ["MysteryBoxRule", {
-            "winner_count": 1,
-            "expires_in_days": 30
-        }]
-    ],
-    "job": {
-        "trigger": "cron",
-        "cron": {
-            "minute": "0,30",
-            "hour": "9-17",
-            "day_of_week": "mon-fri"
-        },
-        "id": "mystery_box_workday",
-        "name": "Workday Mystery Box",
-        "timezone": "America/New_York"
-    }
-}
+    Handlers that only write the examples to an HTTP response can use
+    this directly and skip the decode step.
+    """
+    import importlib.resources
+    return importlib.resources.files(__package__).joinpath(
+        'mystery_box_examples.md'
+    ).read_bytes()
 
-## Weekly Big Mystery Box (higher chances, more winners)
-{
-    "reward_id": 9001,
-    "reward": "Friday Jackpot Mystery Box",
-    "description": "Big weekly mystery box with boosted legendary chances!",
-    "points": 0,
-    "reward_type": "Computed Badge",
-    "reward_category": "Mystery Box",
-    "reward_group": "Weekly Events",
-    "multiple": true,
-    "rules": [
-        ["MysteryBoxRule", {
-            "winner_count": 10,
-            "expires_in_days": 14,
-            "tier_boost": {
-                "5": 0.10,
-                "4": 0.15
-            },
-            "eligibility": {
-                "min_tenure_days": 30,
-                "exclude_recent_winners_days": 7
-            }
-        }]
-    ],
-    "job": {
-        "trigger": "cron",
-        "cron": {
-            "day_of_week": "fri",
-            "hour": 16,
-            "minute": 0
-        },
-        "id": "mystery_box_friday_jackpot",
-        "name": "Friday Jackpot Mystery Box"
-    }
-}
 
-## Monthly Premium Mystery Box
-{
-    "reward_id": 9002,
-    "reward": "Monthly Premium Mystery Box",
-    "description": "Exclusive monthly mystery box with premium prizes only!",
-    "points": 0,
-    "reward_type": "Computed Badge",
-    "reward_category": "Mystery Box",
-    "reward_group": "Monthly Events",
-    "multiple": true,
-    "rules": [
-        ["MysteryBoxRule", {
-            "winner_count": 5,
-            "expires_in_days": 60,
-            "tier_boost": {
-                "5": 0.20,
-                "4": 0.30,
-                "3": 0.30,
-                "2": 0.15,
-                "1": 0.05
-            },
-            "prize_pool_filter": {
-                "tier_ids": [3, 4, 5],
-                "min_value": 50.00
-            }
-        }]
-    ],
-    "job": {
-        "trigger": "cron",
-        "cron": {
-            "day": "last",
-            "hour": 12,
-            "minute": 0
-        },
-        "id": "mystery_box_monthly_premium",
-        "name": "Monthly Premium Mystery Box"
-    }
-}
+def get_examples() -> str:
+    """Return the example Mystery Box configurations for rewards.json.
 
-## Holiday Special Mystery Box (one-time)
-{
-    "reward_id": 9003,
-    "reward": "Holiday Special Mystery Box",
-    "description": "Special holiday mystery box event!",
-    "points": 0,
-    "reward_type": "Computed Badge",
-    "reward_category": "Mystery Box",
-    "reward_group": "Special Events",
-    "rules": [
-        ["MysteryBoxRule", {
-            "winner_count": 50,
-            "expires_in_days": 30,
-            "tier_boost": {
-                "5": 0.15,
-                "4": 0.25
-            }
-        }]
-    ],
-    "job": {
-        "trigger": "date",
-        "run_date": "2025-12-25 10:00:00",
-        "id": "mystery_box_holiday_2025",
-        "name": "Holiday Special 2025"
-    }
-}
-"""
+    The examples live in ``mystery_box_examples.md`` and are read on
+    demand, keeping the ~3KB documentation blob out of the module's
+    import-time constants.
+    """
+    return get_examples_bytes().decode('utf-8')
@@ -7,14 +7,23 @@ This module provides the core business logic for:
 - Prize redemption with validation
 - Metrics and reporting
 """
+import base64
+import contextvars
+import hashlib
 import random
 import secrets
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from itertools import accumulate
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 from dataclasses import dataclass, field
 import asyncio
 
+import orjson
 from navconfig.logging import logging
 from asyncdb import AsyncDB
 
@@ -33,7 +42,119 @@ from .models import (
 )
 
 
-@dataclass
+# Mystery-box pool cache: tier rates and the mystery-eligible prize pool
+# change rarely but were re-read from Postgres on every scheduled draw.
+# Module-level so the short-lived service instance each scheduler tick
+# creates still hits it. {key: (expires_at, value)}
+_POOL_CACHE: Dict[str, Tuple[float, Any]] = {}
+_POOL_CACHE_TTL = 300
+
+# Same unambiguous alphabet the rewards.generate_redemption_code() SQL
+# function uses (no I/O/0/1).
+_CODE_ALPHABET = 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789'
+
+
+def _redemption_code() -> str:
+    """
+    Generate an RDM-XXXXX-XXXXX redemption code from one urandom draw.
+
+    The 32-character alphabet maps evenly onto 5 bits, so masking each
+    random byte keeps the distribution uniform. Generating in-process
+    skips the plpgsql per-character loop the DB trigger falls back to.
+    """
+    chars = [_CODE_ALPHABET[b & 31] for b in secrets.token_bytes(10)]
+    return f"RDM-{''.join(chars[:5])}-{''.join(chars[5:])}"
+
+def encode_catalog_cursor(row: Dict[str, Any]) -> str:
+    """Build the opaque keyset cursor for a catalog row.
+
+    Clients pass this back as ?after= to resume a listing directly
+    after the row, regardless of how deep in the catalog it sits.
+    tier_level is coalesced to 0 (the MV left-joins prize_tiers, so
+    untiered prizes carry NULL) to keep the keyset comparable.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps([
+        row['is_featured'], row['tier_level'] or 0,
+        row['prize_name'], row['prize_id'],
+    ])).decode('ascii')
+
+
+def decode_catalog_cursor(token: str) -> Optional[Tuple[Any, ...]]:
+    """Decode an ?after= cursor; malformed tokens yield None."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(token))
+    except Exception:  # pylint: disable=W0703
+        return None
+    if not isinstance(values, list) or len(values) != 4:
+        return None
+    return tuple(values)
+
+
+# Connection bound to the current task for the duration of a service
+# call chain: nested helpers reuse one pool checkout instead of paying
+# acquire/release per statement. A ContextVar keeps concurrent request
+# handlers isolated on the shared event loop.
+_ACTIVE_CONN: contextvars.ContextVar = contextvars.ContextVar(
+    'marketplace_conn', default=None
+)
+
+# Prepared-statement cache for hot writes, keyed weakly by the raw
+# asyncpg connection so entries die with the pooled connection.
+_STMT_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _prepared(driver, sql: str):
+    """Return a per-connection cached prepared statement for `sql`."""
+    try:
+        cache = _STMT_CACHE[driver]
+    except KeyError:
+        cache = _STMT_CACHE.setdefault(driver, {})
+    stmt = cache.get(sql)
+    if stmt is None:
+        stmt = cache[sql] = await driver.prepare(sql)
+    return stmt
+
+
+# Reference-data cache for the reads that sit on nearly every award or
+# redemption path but change on admin timescales. Same shape as
+# _POOL_CACHE: {key: (expires_at, value)}. Prizes get a short TTL since
+# stock moves with every award; tiers are effectively static.
+_READ_CACHE: Dict[Tuple, Tuple[float, Any]] = {}
+_TTL_CATEGORIES = 300
+_TTL_TIERS = 3600
+_TTL_PRIZE = 30
+
+# Single-flight futures for in-progress prize fetches: under a burst of
+# lookups for the same prize (popular prize during an event), only the
+# first miss queries; the rest await its future. Module-level because
+# handlers build a service instance per request.
+_INFLIGHT: Dict[Tuple, asyncio.Future] = {}
+
+# The in-flight materialized-view refresh task. Module-level for the
+# same reason as the caches above (a service instance lives one
+# request) and so the task keeps a hard reference: a bare create_task
+# result can be garbage-collected mid-execution. _REFRESH_AGAIN marks
+# writes that landed while a refresh was running.
+_REFRESH_TASK: Optional[asyncio.Task] = None
+_REFRESH_AGAIN = False
+
+
+def invalidate_prize_pool_cache() -> None:
+    """Drop cached tier rates, prize pools and reference reads."""
+    _POOL_CACHE.clear()
+    _READ_CACHE.clear()
+
+
+# Columns an admin may change through update_prize: everything on the
+# model except the primary key and the audit/soft-delete stamps, which
+# the service writes itself.
+_PRIZE_COLUMNS = frozenset(PrizeCatalog.get_columns()) - {
+    'prize_id', 'created_at', 'created_by',
+    'updated_at', 'updated_by', 'deleted_at', 'deleted_by',
+}
+
+
+@dataclass(slots=True)
 class AwardResult:
     """Result of a prize award operation."""
     success: bool
@@ -43,7 +164,7 @@ class AwardResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RedemptionResult:
     """Result of a redemption operation."""
     success: bool
@@ -54,7 +175,7 @@ class RedemptionResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MysteryBoxResult:
     """Result of a mystery box event."""
     success: bool
@@ -77,20 +198,122 @@ class MarketplaceService:
     - Metrics calculation
     """
 
-    def __init__(self, connection: AsyncDB = None, logger=None):
+    def __init__(self, connection: AsyncDB = None, logger=None, cache=None):
         self.connection = connection
         self.logger = logger or logging.getLogger('Rewards.Marketplace')
+        # Optional Redis handle (the engine's shared cache) used to
+        # memoize eligibility scans across scheduled events.
+        self.cache = cache
         self._schema = "rewards"
+        # Built once so the hot award path reuses the exact same SQL
+        # text (and thus the same prepared plan) on every call. The CTE
+        # fuses the prize read, the stock/eligibility checks and the
+        # INSERT into one round trip; the failure column tells the
+        # caller why nothing was inserted.
+        self._insert_award_sql = f"""
+            WITH p AS (
+                SELECT prize_id, prize_name, is_active,
+                       total_quantity, available_quantity, reserved_quantity,
+                       max_per_user, cooldown_days,
+                       points_cost, monetary_value
+                FROM {self._schema}.prize_catalog
+                WHERE prize_id = $1 AND deleted_at IS NULL
+            ), e AS (
+                -- O(1) primary-key lookup on the trigger-maintained
+                -- summary instead of COUNT/MAX over the award history;
+                -- the one-row join keeps e non-empty when no summary
+                -- row exists yet.
+                SELECT COALESCE(s.awards_count, 0) AS total_awards,
+                       s.last_awarded_at AS last_awarded
+                FROM (SELECT 1) AS one
+                LEFT JOIN {self._schema}.prize_award_summary s
+                    ON s.prize_id = $1 AND s.user_id = $2
+            ), ins AS (
+                INSERT INTO {self._schema}.prize_awards (
+                    prize_id, user_id, user_email, user_employee_id,
+                    source, source_reference_id, source_reference_type,
+                    linked_award_id, awarded_by_user_id, awarded_by_email,
+                    award_message, status, expires_at,
+                    points_value, monetary_value, metadata
+                )
+                SELECT p.prize_id, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+                       $11, $12, $13,
+                       COALESCE(p.points_cost, 0), p.monetary_value, $14
+                FROM p CROSS JOIN e
+                WHERE p.is_active
+                  AND (p.total_quantity IS NULL
+                       OR (COALESCE(p.available_quantity, 0)
+                           - COALESCE(p.reserved_quantity, 0)) > 0)
+                  AND (p.max_per_user IS NULL
+                       OR e.total_awards < p.max_per_user)
+                  AND (COALESCE(p.cooldown_days, 0) = 0
+                       OR e.last_awarded IS NULL
+                       OR e.last_awarded
+                          + (p.cooldown_days * INTERVAL '1 day') <= NOW())
+                RETURNING award_id
+            )
+            SELECT
+                (SELECT award_id FROM ins) AS award_id,
+                (SELECT prize_name FROM p) AS prize_name,
+                CASE
+                    WHEN NOT EXISTS (SELECT 1 FROM p) THEN 'not_found'
+                    WHEN NOT (SELECT is_active FROM p) THEN 'inactive'
+                    WHEN (SELECT total_quantity FROM p) IS NOT NULL
+                         AND (SELECT COALESCE(available_quantity, 0)
+                              - COALESCE(reserved_quantity, 0) FROM p) <= 0
+                        THEN 'out_of_stock'
+                    WHEN EXISTS (SELECT 1 FROM ins) THEN NULL
+                    ELSE 'not_eligible'
+                END AS failure
+        """
+        # One prepared UPDATE covers every status-change path; see
+        # update_redemption_status.
+        self._update_redemption_sql = f"""
+            UPDATE {self._schema}.prize_redemptions
+            SET status = $1,
+                fulfillment_details = COALESCE($2, fulfillment_details),
+                tracking_number = COALESCE($3, tracking_number),
+                shipped_at = CASE WHEN $4 THEN NOW() ELSE shipped_at END,
+                admin_notes = COALESCE($5, admin_notes),
+                cancelled_reason = COALESCE($6, cancelled_reason),
+                approved_by = COALESCE($7, approved_by),
+                cancelled_by = COALESCE($8, cancelled_by),
+                metadata = metadata || jsonb_build_object(
+                    'changed_by', $9::text
+                )
+            WHERE redemption_id = $10
+            RETURNING redemption_id, status
+        """
 
     async def set_connection(self, connection: AsyncDB):
         """Set the database connection."""
         self.connection = connection
 
+    @asynccontextmanager
+    async def _conn(self):
+        """
+        Yield a pooled connection, reusing any already bound to the task.
+
+        The pool itself is sized once at application startup (see
+        app.py); this only collapses nested per-statement checkouts
+        within one service call into a single acquire/release.
+        """
+        conn = _ACTIVE_CONN.get()
+        if conn is not None:
+            yield conn
+            return
+        async with await self.connection.acquire() as conn:
+            token = _ACTIVE_CONN.set(conn)
+            try:
+                yield conn
+            finally:
+                _ACTIVE_CONN.reset(token)
+
     # =========================================================================
     # CATALOG OPERATIONS
     # =========================================================================
 
-    async def get_catalog(
+    def _catalog_query(
         self,
         category_id: Optional[int] = None,
         tier_id: Optional[int] = None,
@@ -100,46 +323,17 @@ class MarketplaceService:
         mystery_eligible_only: bool = False,
         search_term: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> List[Dict[str, Any]]:
-        """
-        Get prizes from the catalog with filtering options.
-
-        Args:
-            category_id: Filter by category
-            tier_id: Filter by tier/rarity
-            is_active: Only active prizes (default True)
-            is_featured: Filter by featured status
-            in_stock_only: Only prizes with available stock
-            mystery_eligible_only: Only mystery box eligible prizes
-            search_term: Search in name/description
-            limit: Max results
-            offset: Pagination offset
-
-        Returns:
-            List of prize dictionaries with computed fields
-        """
+        offset: int = 0,
+        after: Optional[Tuple[Any, ...]] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build the filtered catalog SELECT and its parameters."""
+        # The materialized view pre-joins tiers, categories and linked
+        # badges and bakes in the computed stock columns, so a catalog
+        # list is one indexed scan. The view is refreshed after every
+        # catalog write (see schedule_catalog_refresh).
         query = """
-            SELECT
-                pc.*,
-                pt.tier_name,
-                pt.tier_level,
-                pt.color_code AS tier_color,
-                pt.drop_rate,
-                pcat.category_name,
-                r.reward AS linked_badge_name,
-                r.icon AS linked_badge_icon,
-                CASE
-                    WHEN pc.total_quantity IS NULL THEN 'unlimited'
-                    WHEN pc.available_quantity <= 0 THEN 'out_of_stock'
-                    WHEN pc.available_quantity <= (pc.total_quantity * 0.1) THEN 'low_stock'
-                    ELSE 'in_stock'
-                END AS stock_status,
-                COALESCE(pc.available_quantity, 999999) - COALESCE(pc.reserved_quantity, 0) AS effective_quantity
-            FROM {schema}.prize_catalog pc
-            LEFT JOIN {schema}.prize_tiers pt ON pc.tier_id = pt.tier_id
-            LEFT JOIN {schema}.prize_categories pcat ON pc.category_id = pcat.category_id
-            LEFT JOIN {schema}.rewards r ON pc.linked_reward_id = r.reward_id
+            SELECT pc.*
+            FROM {schema}.mv_prize_catalog_view pc
             WHERE pc.deleted_at IS NULL
         """.format(schema=self._schema)
 
@@ -182,15 +376,120 @@ class MarketplaceService:
             query += f" AND (pc.prize_name ILIKE ${param_count} OR pc.description ILIKE ${param_count})"
             params.append(f"%{search_term}%")
 
-        query += f" ORDER BY pc.is_featured DESC, pt.tier_level DESC, pc.prize_name"
-        query += f" LIMIT {limit} OFFSET {offset}"
+        if after is not None:
+            # Keyset pagination: resume strictly after the cursor row in
+            # the sort order below. The OR-expansion (rather than a row
+            # constructor) is required because the directions are mixed
+            # (featured/tier descend, name/id ascend). tier_level is
+            # coalesced on both sides: a NULL (untiered prize) would make
+            # every comparison false and silently drop the row.
+            a, b, c, d = (
+                param_count + 1, param_count + 2,
+                param_count + 3, param_count + 4
+            )
+            query += f""" AND (
+                pc.is_featured < ${a}
+                OR (pc.is_featured = ${a} AND COALESCE(pc.tier_level, 0) < ${b})
+                OR (pc.is_featured = ${a} AND COALESCE(pc.tier_level, 0) = ${b}
+                    AND pc.prize_name > ${c})
+                OR (pc.is_featured = ${a} AND COALESCE(pc.tier_level, 0) = ${b}
+                    AND pc.prize_name = ${c} AND pc.prize_id > ${d})
+            )"""
+            params.extend(after)
+            param_count += 4
 
-        async with await self.connection.acquire() as conn:
-            results = await conn.fetch_all(query, params)
+        query += (
+            " ORDER BY pc.is_featured DESC, COALESCE(pc.tier_level, 0) DESC,"
+            " pc.prize_name, pc.prize_id"
+        )
+        # Parameterized paging keeps the SQL text identical for every
+        # page of a given filter shape, so the per-connection prepared
+        # plan is reused across pages.
+        query += f" LIMIT ${param_count + 1}"
+        params.append(limit)
+        if after is None:
+            query += f" OFFSET ${param_count + 2}"
+            params.append(offset)
+
+        return query, params
+
+    async def get_catalog(self, **filters) -> List[Dict[str, Any]]:
+        """
+        Get prizes from the catalog with filtering options.
+
+        Accepts the same filters as _catalog_query (category_id, tier_id,
+        is_active, is_featured, in_stock_only, mystery_eligible_only,
+        search_term, limit, offset, after). Pass an `after` cursor from
+        encode_catalog_cursor for keyset paging instead of offset.
+
+        Returns:
+            List of prize dictionaries with computed fields
+        """
+        query, params = self._catalog_query(**filters)
+        async with self._conn() as conn:
+            stmt = await _prepared(conn.get_connection(), query)
+            results = await stmt.fetch(*params)
             return [dict(r) for r in results]
 
+    async def get_catalog_json(self, **filters) -> str:
+        """
+        Get the filtered catalog as one server-encoded JSON document.
+
+        Postgres aggregates the rows with json_agg, so listing a large
+        catalog allocates no per-row Python objects at all: the handler
+        writes the returned text straight into the HTTP response. The
+        document has the shape {"prizes": [...], "count": N, "next": T},
+        where "next" is the keyset cursor for the last row of a full
+        page (null on the final page); clients pass it back as ?after=.
+        """
+        query, params = self._catalog_query(**filters)
+        # The cursor is built server-side too: the last row's sort keys,
+        # JSON-encoded and base64'd url-safe (translate swaps +/ for -_
+        # and strips the newlines encode() inserts), so it round-trips
+        # through decode_catalog_cursor unchanged.
+        limit_param = len(params) + 1
+        json_query = f"""
+            SELECT json_build_object(
+                'prizes', COALESCE(json_agg(v), '[]'::json),
+                'count', COUNT(*),
+                'next', CASE WHEN COUNT(*) >= ${limit_param} THEN
+                    translate(
+                        encode(convert_to(
+                            (json_agg(json_build_array(
+                                v.is_featured, COALESCE(v.tier_level, 0),
+                                v.prize_name, v.prize_id
+                            )) -> -1)::text,
+                            'UTF8'
+                        ), 'base64'),
+                        '+/' || chr(10), '-_'
+                    )
+                END
+            )::text
+            FROM ({query}) AS v
+        """
+        params.append(filters.get('limit', 50))
+        async with self._conn() as conn:
+            stmt = await _prepared(conn.get_connection(), json_query)
+            return await stmt.fetchval(*params)
+
     async def get_prize(self, prize_id: int) -> Optional[Dict[str, Any]]:
-        """Get a single prize with all details."""
+        """Get a single prize with all details (30s TTL, single-flight)."""
+        key = ('prize', prize_id)
+        entry = _READ_CACHE.get(key)
+        if entry and entry[0] > time.monotonic():
+            cached = entry[1]
+            return dict(cached) if cached else None
+
+        # Coalesce concurrent misses: everyone after the first awaits
+        # the same fetch instead of issuing duplicate three-join SELECTs.
+        fut = _INFLIGHT.get(key)
+        if fut is not None:
+            prize = await fut
+            return dict(prize) if prize else None
+
+        fut = asyncio.get_running_loop().create_future()
+        _INFLIGHT[key] = fut
+
         query = """
             SELECT
                 pc.*,
@@ -206,30 +505,172 @@ class MarketplaceService:
             WHERE pc.prize_id = $1 AND pc.deleted_at IS NULL
         """.format(schema=self._schema)
 
-        async with await self.connection.acquire() as conn:
-            result = await conn.fetchrow(query, [prize_id])
-            return dict(result) if result else None
+        try:
+            async with self._conn() as conn:
+                result = await conn.fetchrow(query, [prize_id])
+                prize = dict(result) if result else None
+            _READ_CACHE[key] = (time.monotonic() + _TTL_PRIZE, prize)
+            fut.set_result(prize)
+        except BaseException as err:
+            fut.set_exception(err)
+            raise
+        finally:
+            _INFLIGHT.pop(key, None)
+        # Hand out a copy so callers cannot mutate the cached row.
+        return dict(prize) if prize else None
+
+    async def create_prize(
+        self,
+        fields: Dict[str, Any],
+        created_by: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Insert a prize with one dynamically shaped INSERT.
+
+        Like update_prize, payload keys are intersected with the model's
+        column set; defaults for omitted columns come from the table
+        definition instead of per-request model construction.
+        """
+        values = {k: v for k, v in fields.items() if k in _PRIZE_COLUMNS}
+        if not values:
+            return None
+
+        columns = list(values)
+        placeholders = [f"${i}" for i in range(1, len(columns) + 1)]
+        params = list(values.values())
+        params.append(created_by)
+
+        query = f"""
+            INSERT INTO {self._schema}.prize_catalog
+                ({', '.join(columns)}, created_by)
+            VALUES ({', '.join(placeholders)}, ${len(params)})
+            RETURNING prize_id
+        """
+
+        async with self._conn() as conn:
+            prize_id = await conn.fetchval(query, *params)
+        if prize_id is not None:
+            self.schedule_catalog_refresh()
+        return prize_id
+
+    async def update_prize(
+        self,
+        prize_id: int,
+        fields: Dict[str, Any],
+        updated_by: Optional[str] = None
+    ) -> bool:
+        """
+        Update a prize with a single UPDATE statement.
+
+        Payload keys are intersected with the model's column set, so the
+        read-modify-write cycle (SELECT, setattr loop, UPDATE) collapses
+        into one round trip.
+
+        Returns:
+            True if a live row was updated, False otherwise.
+        """
+        updates = {k: v for k, v in fields.items() if k in _PRIZE_COLUMNS}
+        if not updates:
+            return False
+
+        assignments = []
+        params = []
+        for idx, (name, value) in enumerate(updates.items(), start=1):
+            assignments.append(f"{name} = ${idx}")
+            params.append(value)
+        params.append(updated_by)
+        params.append(prize_id)
+
+        query = f"""
+            UPDATE {self._schema}.prize_catalog
+            SET {', '.join(assignments)},
+                updated_at = now(),
+                updated_by = ${len(params) - 1}
+            WHERE prize_id = ${len(params)} AND deleted_at IS NULL
+            RETURNING 1
+        """
+
+        async with self._conn() as conn:
+            result = await conn.fetchval(query, *params)
+        if result is not None:
+            _READ_CACHE.pop(('prize', prize_id), None)
+            self.schedule_catalog_refresh()
+        return result is not None
+
+    async def refresh_catalog_view(self) -> None:
+        """Refresh the materialized catalog view after a catalog write."""
+        try:
+            async with self._conn() as conn:
+                await conn.execute(
+                    f"REFRESH MATERIALIZED VIEW CONCURRENTLY "
+                    f"{self._schema}.mv_prize_catalog_view"
+                )
+        except Exception as err:  # pylint: disable=W0703
+            self.logger.warning(
+                f"Catalog view refresh failed: {err}"
+            )
+
+    def schedule_catalog_refresh(self) -> None:
+        """
+        Queue a concurrent view refresh without blocking the caller.
+
+        Catalog writes are rare (admin-only), so a background
+        REFRESH ... CONCURRENTLY keeps the write path fast while readers
+        keep hitting the old snapshot until the refresh lands. The task
+        is held module-side so it cannot be garbage-collected mid-run,
+        and overlapping writes coalesce: a write landing while a refresh
+        is in flight flags one follow-up pass instead of stacking
+        REFRESH statements on the view's lock.
+        """
+        global _REFRESH_TASK, _REFRESH_AGAIN  # pylint: disable=W0603
+        if _REFRESH_TASK is not None and not _REFRESH_TASK.done():
+            _REFRESH_AGAIN = True
+            return
+        _REFRESH_TASK = asyncio.create_task(self._refresh_catalog_loop())
+
+    async def _refresh_catalog_loop(self) -> None:
+        """Refresh the view, repeating once if writes landed meanwhile."""
+        global _REFRESH_AGAIN  # pylint: disable=W0603
+        while True:
+            _REFRESH_AGAIN = False
+            await self.refresh_catalog_view()
+            if not _REFRESH_AGAIN:
+                return
 
     async def get_categories(self, active_only: bool = True) -> List[Dict[str, Any]]:
-        """Get all prize categories."""
+        """Get all prize categories (5min TTL cached)."""
+        key = ('categories', active_only)
+        entry = _READ_CACHE.get(key)
+        if entry and entry[0] > time.monotonic():
+            return [dict(r) for r in entry[1]]
+
         query = f"""
             SELECT * FROM {self._schema}.prize_categories
             WHERE ($1 = FALSE OR is_active = TRUE)
             ORDER BY display_order, category_name
         """
-        async with await self.connection.acquire() as conn:
+        async with self._conn() as conn:
             results = await conn.fetch_all(query, [active_only])
-            return [dict(r) for r in results]
+            rows = [dict(r) for r in results]
+        _READ_CACHE[key] = (time.monotonic() + _TTL_CATEGORIES, rows)
+        return [dict(r) for r in rows]
 
     async def get_tiers(self) -> List[Dict[str, Any]]:
-        """Get all prize tiers."""
+        """Get all prize tiers (1h TTL cached)."""
+        key = ('tiers',)
+        entry = _READ_CACHE.get(key)
+        if entry and entry[0] > time.monotonic():
+            return [dict(r) for r in entry[1]]
+
         query = f"""
             SELECT * FROM {self._schema}.prize_tiers
             ORDER BY tier_level
         """
-        async with await self.connection.acquire() as conn:
+        async with self._conn() as conn:
             results = await conn.fetch_all(query)
-            return [dict(r) for r in results]
+            rows = [dict(r) for r in results]
+        _READ_CACHE[key] = (time.monotonic() + _TTL_TIERS, rows)
+        return [dict(r) for r in rows]
 
     # =========================================================================
     # PRIZE AWARDING
@@ -273,83 +714,55 @@ class MarketplaceService:
             AwardResult with success status and award details
         """
         try:
-            # Get prize details
-            prize = await self.get_prize(prize_id)
-            if not prize:
-                return AwardResult(
-                    success=False,
-                    error="Prize not found"
-                )
-
-            if not prize.get('is_active'):
-                return AwardResult(
-                    success=False,
-                    error="Prize is not active"
-                )
-
-            # Check stock
-            if prize.get('total_quantity') is not None:
-                effective = (prize.get('available_quantity') or 0) - (prize.get('reserved_quantity') or 0)
-                if effective <= 0:
-                    return AwardResult(
-                        success=False,
-                        error="Prize is out of stock"
-                    )
-
-            # Check user eligibility (max per user, cooldown)
-            if not await self._check_user_eligibility(prize_id, user_id, prize):
-                return AwardResult(
-                    success=False,
-                    error="User is not eligible for this prize (max limit or cooldown)"
-                )
-
             # Calculate expiration
             expires_at = None
             if expires_in_days:
                 expires_at = datetime.now() + timedelta(days=expires_in_days)
 
-            # Create the award
-            insert_query = f"""
-                INSERT INTO {self._schema}.prize_awards (
-                    prize_id, user_id, user_email, user_employee_id,
-                    source, source_reference_id, source_reference_type,
-                    linked_award_id, awarded_by_user_id, awarded_by_email,
-                    award_message, status, expires_at,
-                    points_value, monetary_value, metadata
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16
-                )
-                RETURNING award_id, awarded_at
-            """
-
+            # The fused CTE reads the prize, checks stock, max-per-user
+            # and cooldown, and inserts in a single statement, so the
+            # whole award is one round trip on one snapshot.
             params = [
                 prize_id, user_id, user_email, user_employee_id,
                 source.value, source_reference_id, source_reference_type,
                 linked_award_id, awarded_by_user_id, awarded_by_email,
                 award_message, AwardStatus.AVAILABLE.value, expires_at,
-                prize.get('points_cost', 0), prize.get('monetary_value'),
                 metadata or {}
             ]
 
-            async with await self.connection.acquire() as conn:
-                result = await conn.fetchrow(insert_query, params)
+            async with self._conn() as conn:
+                stmt = await _prepared(
+                    conn.get_connection(), self._insert_award_sql
+                )
+                result = await stmt.fetchrow(*params)
 
-                if result:
-                    self.logger.info(
-                        f"Prize {prize_id} awarded to user {user_id} "
-                        f"(award_id: {result['award_id']}, source: {source.value})"
-                    )
+            failure = result['failure'] if result else 'not_found'
+            if failure is None:
+                # Stock moved via the award trigger; drop the cached row.
+                _READ_CACHE.pop(('prize', prize_id), None)
+                self.logger.info(
+                    f"Prize {prize_id} awarded to user {user_id} "
+                    f"(award_id: {result['award_id']}, source: {source.value})"
+                )
+                return AwardResult(
+                    success=True,
+                    award_id=result['award_id'],
+                    message=f"Prize '{result['prize_name']}' successfully awarded"
+                )
 
-                    return AwardResult(
-                        success=True,
-                        award_id=result['award_id'],
-                        message=f"Prize '{prize['prize_name']}' successfully awarded"
-                    )
-                else:
-                    return AwardResult(
-                        success=False,
-                        error="Failed to create award record"
-                    )
+            errors = {
+                'not_found': "Prize not found",
+                'inactive': "Prize is not active",
+                'out_of_stock': "Prize is out of stock",
+                'not_eligible': (
+                    "User is not eligible for this prize "
+                    "(max limit or cooldown)"
+                ),
+            }
+            return AwardResult(
+                success=False,
+                error=errors.get(failure, "Failed to create award record")
+            )
 
         except Exception as err:
             self.logger.error(f"Error awarding prize: {err}")
@@ -358,47 +771,6 @@ class MarketplaceService:
                 error=str(err)
             )
 
-    async def _check_user_eligibility(
-        self,
-        prize_id: int,
-        user_id: int,
-        prize: Dict[str, Any]
-    ) -> bool:
-        """Check if user is eligible for this prize."""
-        max_per_user = prize.get('max_per_user')
-        cooldown_days = prize.get('cooldown_days', 0)
-
-        if not max_per_user and cooldown_days == 0:
-            return True
-
-        query = f"""
-            SELECT COUNT(*) as total_awards,
-                   MAX(awarded_at) as last_awarded
-            FROM {self._schema}.prize_awards
-            WHERE prize_id = $1
-              AND user_id = $2
-              AND status != 'cancelled'
-        """
-
-        async with await self.connection.acquire() as conn:
-            result = await conn.fetchrow(query, [prize_id, user_id])
-
-            if result:
-                total_awards = result['total_awards']
-                last_awarded = result['last_awarded']
-
-                # Check max per user
-                if max_per_user and total_awards >= max_per_user:
-                    return False
-
-                # Check cooldown
-                if cooldown_days > 0 and last_awarded:
-                    cooldown_end = last_awarded + timedelta(days=cooldown_days)
-                    if datetime.now() < cooldown_end:
-                        return False
-
-            return True
-
     # =========================================================================
     # REDEMPTION OPERATIONS
     # =========================================================================
@@ -437,7 +809,7 @@ class MarketplaceService:
                 WHERE pa.award_id = $1
             """
 
-            async with await self.connection.acquire() as conn:
+            async with self._conn() as conn:
                 award = await conn.fetchrow(award_query, [award_id])
 
                 if not award:
@@ -460,17 +832,11 @@ class MarketplaceService:
                         error=f"Award cannot be redeemed (status: {award['status']})"
                     )
 
-                # Check expiration
+                # Check expiration. Read-side rejection only: the
+                # batched sweep (expire_old_awards) owns the status
+                # flip, so the redemption hot path never pays a second
+                # write for awards the sweep has not reached yet.
                 if award['expires_at'] and award['expires_at'] < datetime.now():
-                    # Update award to expired
-                    await conn.execute(
-                        f"""
-                        UPDATE {self._schema}.prize_awards
-                        SET status = 'expired', status_changed_at = NOW()
-                        WHERE award_id = $1
-                        """,
-                        [award_id]
-                    )
                     return RedemptionResult(
                         success=False,
                         error="Award has expired"
@@ -481,20 +847,23 @@ class MarketplaceService:
                 if award['requires_approval']:
                     initial_status = RedemptionStatus.PENDING_APPROVAL.value
 
-                # Create redemption record
-                # Note: The trigger will generate the redemption code and update award status
+                # Create redemption record. The code is generated here in
+                # one urandom draw; the DB trigger only fills codes left
+                # NULL, so it remains as a fallback for other writers.
                 insert_query = f"""
                     INSERT INTO {self._schema}.prize_redemptions (
                         award_id, prize_id, user_id, status,
-                        fulfillment_method, shipping_address, metadata
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+                        fulfillment_method, shipping_address, metadata,
+                        redemption_code
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
                     RETURNING redemption_id, redemption_code
                 """
 
                 result = await conn.fetchrow(insert_query, [
                     award_id, award['prize_id'], user_id, initial_status,
                     fulfillment_method or award['fulfillment_type'],
-                    shipping_address, metadata or {}
+                    shipping_address, metadata or {},
+                    _redemption_code()
                 ])
 
                 if result:
@@ -551,65 +920,37 @@ class MarketplaceService:
             RedemptionResult indicating success/failure
         """
         try:
-            update_parts = ["status = $1"]
-            params = [new_status.value]
-            param_count = 1
-
-            # Build dynamic update
-            if fulfillment_details:
-                param_count += 1
-                update_parts.append(f"fulfillment_details = ${param_count}")
-                params.append(fulfillment_details)
-
-            if tracking_number:
-                param_count += 1
-                update_parts.append(f"tracking_number = ${param_count}")
-                params.append(tracking_number)
-
-                if new_status == RedemptionStatus.SHIPPED:
-                    update_parts.append("shipped_at = NOW()")
-
-            if admin_notes:
-                param_count += 1
-                update_parts.append(f"admin_notes = ${param_count}")
-                params.append(admin_notes)
-
-            if reason:
-                param_count += 1
-                update_parts.append(f"cancelled_reason = ${param_count}")
-                params.append(reason)
-
+            # Fixed-shape UPDATE: COALESCE keeps untouched columns at
+            # their current value, so one prepared statement covers
+            # every combination of optional fields instead of a freshly
+            # parsed SQL string per combination.
+            approved_by = None
+            cancelled_by = None
             if updated_by_user_id:
                 if new_status == RedemptionStatus.APPROVED:
-                    param_count += 1
-                    update_parts.append(f"approved_by = ${param_count}")
-                    params.append(updated_by_user_id)
+                    approved_by = updated_by_user_id
                 elif new_status in [RedemptionStatus.CANCELLED, RedemptionStatus.REJECTED]:
-                    param_count += 1
-                    update_parts.append(f"cancelled_by = ${param_count}")
-                    params.append(updated_by_user_id)
+                    cancelled_by = updated_by_user_id
 
-            # Add metadata for trigger to track who made the change
-            param_count += 1
-            update_parts.append(f"""
-                metadata = metadata || jsonb_build_object(
-                    'changed_by', ${param_count}::text
-                )
-            """)
-            params.append(updated_by_email or str(updated_by_user_id))
-
-            param_count += 1
-            params.append(redemption_id)
-
-            query = f"""
-                UPDATE {self._schema}.prize_redemptions
-                SET {', '.join(update_parts)}
-                WHERE redemption_id = ${param_count}
-                RETURNING redemption_id, status
-            """
+            params = [
+                new_status.value,
+                fulfillment_details or None,
+                tracking_number or None,
+                bool(tracking_number) and new_status == RedemptionStatus.SHIPPED,
+                admin_notes or None,
+                reason or None,
+                approved_by,
+                cancelled_by,
+                # Metadata for the trigger to track who made the change.
+                updated_by_email or str(updated_by_user_id),
+                redemption_id,
+            ]
 
-            async with await self.connection.acquire() as conn:
-                result = await conn.fetchrow(query, params)
+            async with self._conn() as conn:
+                stmt = await _prepared(
+                    conn.get_connection(), self._update_redemption_sql
+                )
+                result = await stmt.fetchrow(*params)
 
                 if result:
                     self.logger.info(
@@ -661,6 +1002,63 @@ class MarketplaceService:
             reason=reason
         )
 
+    async def submit_redemption_feedback(
+        self,
+        redemption_id: int,
+        rating: Optional[int] = None,
+        feedback: Optional[str] = None
+    ) -> RedemptionResult:
+        """
+        Record user feedback on a completed redemption.
+
+        A targeted UPDATE touches only the feedback columns: a model-level
+        update() would include the GENERATED metric columns in its SET
+        list, which Postgres rejects (428C9) on exactly the completed
+        rows feedback applies to.
+        """
+        query = f"""
+            WITH upd AS (
+                UPDATE {self._schema}.prize_redemptions
+                SET user_rating = $1,
+                    user_feedback = $2,
+                    feedback_at = NOW()
+                WHERE redemption_id = $3 AND status = 'completed'
+                RETURNING redemption_id
+            )
+            SELECT
+                EXISTS(SELECT 1 FROM upd) AS updated,
+                EXISTS(
+                    SELECT 1 FROM {self._schema}.prize_redemptions
+                    WHERE redemption_id = $3
+                ) AS found
+        """
+        try:
+            async with self._conn() as conn:
+                result = await conn.fetchrow(
+                    query, [rating, feedback, redemption_id]
+                )
+            if result['updated']:
+                return RedemptionResult(
+                    success=True,
+                    redemption_id=redemption_id,
+                    message="Feedback submitted"
+                )
+            if not result['found']:
+                return RedemptionResult(
+                    success=False,
+                    error="Redemption not found"
+                )
+            return RedemptionResult(
+                success=False,
+                error="Can only provide feedback for completed redemptions"
+            )
+        except Exception as err:
+            self.logger.error(f"Error submitting feedback: {err}")
+            return RedemptionResult(
+                success=False,
+                error=str(err)
+            )
+
     # =========================================================================
     # USER WALLET OPERATIONS
     # =========================================================================
@@ -670,7 +1068,7 @@ class MarketplaceService:
         user_id: int,
         status_filter: Optional[List[str]] = None,
         include_expired: bool = False
-    ) -> List[Dict[str, Any]]:
+    ) -> List[UserPrizeWallet]:
         """
         Get a user's prize wallet (all their awards).
 
@@ -680,7 +1078,7 @@ class MarketplaceService:
             include_expired: Include expired awards
 
         Returns:
-            List of prize awards with redemption info
+            List of UserPrizeWallet rows with redemption info
         """
         query = f"""
             SELECT * FROM {self._schema}.vw_user_prize_wallet
@@ -699,28 +1097,166 @@ class MarketplaceService:
 
         query += " ORDER BY awarded_at DESC"
 
-        async with await self.connection.acquire() as conn:
+        async with self._conn() as conn:
             results = await conn.fetch_all(query, params)
-            return [dict(r) for r in results]
+            # The wallet view pre-joins catalog, tier, category and
+            # redemption data server-side, so each row maps straight to a
+            # UserPrizeWallet without per-row lookups or validation.
+            return [UserPrizeWallet.from_row(r) for r in results]
+
+    async def get_wallet_and_stats(
+        self,
+        user_id: int,
+        status_filter: Optional[List[str]] = None,
+        include_expired: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get a user's wallet and its statistics in one round trip.
+
+        Two CTEs over the wallet view return the award list and the
+        aggregates as a single JSON document, halving the DB latency of
+        the wallet endpoint compared to two sequential queries.
+        """
+        query = f"""
+            WITH awards AS (
+                SELECT * FROM {self._schema}.vw_user_prize_wallet
+                WHERE user_id = $1
+                  AND ($2::text[] IS NULL OR status = ANY($2))
+                  AND ($3 OR is_expired = FALSE)
+                ORDER BY awarded_at DESC
+            ), stats AS (
+                SELECT
+                    COUNT(*) FILTER (WHERE status = 'available' AND NOT is_expired) AS available_count,
+                    COUNT(*) FILTER (WHERE status = 'redeemed') AS redeemed_count,
+                    COUNT(*) FILTER (WHERE status = 'expired' OR is_expired) AS expired_count,
+                    COUNT(*) FILTER (WHERE status = 'reserved') AS pending_count,
+                    COALESCE(SUM(monetary_value) FILTER (WHERE status = 'available'), 0) AS available_value,
+                    COALESCE(SUM(monetary_value) FILTER (WHERE status = 'redeemed'), 0) AS redeemed_value,
+                    COUNT(*) FILTER (WHERE days_until_expiry BETWEEN 0 AND 7) AS expiring_soon
+                FROM {self._schema}.vw_user_prize_wallet
+                WHERE user_id = $1
+            )
+            SELECT json_build_object(
+                'awards', COALESCE((SELECT json_agg(awards) FROM awards), '[]'::json),
+                'stats', (SELECT row_to_json(stats) FROM stats)
+            ) AS wallet
+        """
+
+        async with self._conn() as conn:
+            result = await conn.fetchrow(
+                query, [user_id, status_filter, include_expired]
+            )
+            if result:
+                return result['wallet']
+            return {'awards': [], 'stats': {}}
+
+    async def get_wallets_bulk(
+        self,
+        user_ids: List[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get the wallets of many users in a single query.
+
+        WHERE user_id = ANY($1) with a per-user json_agg replaces the N
+        per-user wallet queries an admin sweep would otherwise issue.
+        """
+        query = f"""
+            SELECT user_id,
+                   json_agg(w ORDER BY awarded_at DESC) AS awards
+            FROM {self._schema}.vw_user_prize_wallet w
+            WHERE user_id = ANY($1::int[])
+            GROUP BY user_id
+        """
+        async with self._conn() as conn:
+            rows = await conn.fetch_all(query, [user_ids])
+            return {r['user_id']: r['awards'] for r in rows}
 
     async def get_user_wallet_stats(self, user_id: int) -> Dict[str, Any]:
-        """Get statistics for a user's prize wallet."""
+        """
+        Get statistics for a user's prize wallet.
+
+        One GROUP BY status scan returns a handful of rows that are folded
+        into the stats dict here, instead of seven FILTER aggregates each
+        re-testing every wallet row.
+        """
         query = f"""
-            SELECT
-                COUNT(*) FILTER (WHERE status = 'available' AND NOT is_expired) AS available_count,
-                COUNT(*) FILTER (WHERE status = 'redeemed') AS redeemed_count,
-                COUNT(*) FILTER (WHERE status = 'expired' OR is_expired) AS expired_count,
-                COUNT(*) FILTER (WHERE status = 'reserved') AS pending_count,
-                COALESCE(SUM(monetary_value) FILTER (WHERE status = 'available'), 0) AS available_value,
-                COALESCE(SUM(monetary_value) FILTER (WHERE status = 'redeemed'), 0) AS redeemed_value,
-                COUNT(*) FILTER (WHERE days_until_expiry BETWEEN 0 AND 7) AS expiring_soon
+            SELECT status,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE is_expired) AS lapsed,
+                   COALESCE(SUM(monetary_value), 0) AS value,
+                   COUNT(*) FILTER (WHERE days_until_expiry BETWEEN 0 AND 7) AS expiring_soon
             FROM {self._schema}.vw_user_prize_wallet
             WHERE user_id = $1
+            GROUP BY status
         """
 
-        async with await self.connection.acquire() as conn:
-            result = await conn.fetchrow(query, [user_id])
-            return dict(result) if result else {}
+        async with self._conn() as conn:
+            rows = await conn.fetch_all(query, [user_id])
+
+        stats: Dict[str, Any] = {
+            'available_count': 0,
+            'redeemed_count': 0,
+            'expired_count': 0,
+            'pending_count': 0,
+            'available_value': 0,
+            'redeemed_value': 0,
+            'expiring_soon': 0,
+        }
+        for row in rows:
+            status = row['status']
+            if status == 'available':
+                stats['available_count'] = row['total'] - row['lapsed']
+                stats['available_value'] = row['value']
+            elif status == 'redeemed':
+                stats['redeemed_count'] = row['total']
+                stats['redeemed_value'] = row['value']
+            elif status == 'reserved':
+                stats['pending_count'] = row['total']
+            # expired status counts whole groups; other statuses only the
+            # rows whose expiry date has already passed.
+            if status == 'expired':
+                stats['expired_count'] += row['total']
+            else:
+                stats['expired_count'] += row['lapsed']
+            stats['expiring_soon'] += row['expiring_soon']
+        return stats
+
+    # =========================================================================
+    # SERVER-ENCODED READS
+    # =========================================================================
+    # Single-row reads encoded by Postgres itself: row_to_json builds the
+    # document server-side, so handlers forward the payload as-is instead
+    # of hydrating a model and walking its fields in Python.
+
+    async def get_award_json(self, award_id: int) -> Optional[str]:
+        """Fetch one prize award as a JSON document."""
+        query = f"""
+            SELECT row_to_json(a)::text
+            FROM {self._schema}.prize_awards a
+            WHERE a.award_id = $1
+        """
+        async with self._conn() as conn:
+            return await conn.fetchval(query, award_id)
+
+    async def get_redemption_json(self, redemption_id: int) -> Optional[str]:
+        """Fetch one redemption as a JSON document."""
+        query = f"""
+            SELECT row_to_json(r)::text
+            FROM {self._schema}.prize_redemptions r
+            WHERE r.redemption_id = $1
+        """
+        async with self._conn() as conn:
+            return await conn.fetchval(query, redemption_id)
+
+    async def get_event_json(self, event_id: int) -> Optional[str]:
+        """Fetch one mystery box event as a JSON document."""
+        query = f"""
+            SELECT row_to_json(e)::text
+            FROM {self._schema}.mystery_box_events e
+            WHERE e.event_id = $1
+        """
+        async with self._conn() as conn:
+            return await conn.fetchval(query, event_id)
 
     # =========================================================================
     # MYSTERY BOX OPERATIONS
@@ -756,7 +1292,7 @@ class MarketplaceService:
             MysteryBoxResult with winners and prizes
         """
         try:
-            async with await self.connection.acquire() as conn:
+            async with self._conn() as conn:
                 # Create event record
                 event_query = f"""
                     INSERT INTO {self._schema}.mystery_box_events (
@@ -807,59 +1343,179 @@ class MarketplaceService:
                 # Select winners
                 winners = random.sample(users, min(winner_count, len(users)))
 
-                # Award prizes to winners
-                prizes_awarded = []
-                for winner_user_id in winners:
-                    # Roll for tier
-                    tier = self._roll_tier(tiers)
-
-                    # Get user email
-                    user_info = await conn.fetchrow(
-                        "SELECT email, associate_id FROM auth.users WHERE user_id = $1",
-                        [winner_user_id]
+                # One round trip for every winner's identity instead of
+                # a SELECT per winner.
+                user_rows = await conn.fetch_all(
+                    "SELECT user_id, email, associate_id FROM auth.users "
+                    "WHERE user_id = ANY($1::int[])",
+                    [winners]
+                )
+                user_info = {r['user_id']: r for r in user_rows}
+
+                # Roll tiers and pick prizes in-process (pure CPU), then
+                # create every award in one bulk INSERT below. The
+                # per-winner stock/eligibility checks award_prize applies
+                # are re-applied inside that INSERT against live catalog
+                # rows (the pools here are TTL-cached and may be stale).
+                # Drawing
+                # server-side (ORDER BY random() / -ln(random())/weight)
+                # was considered and rejected: the tier and prize pools
+                # are TTL-cached in-process, so an SQL draw would re-read
+                # them every event, and the two-stage roll (tier first,
+                # then weight within tier, with the common-tier fallback)
+                # doesn't collapse into one weighted sample. The same
+                # goes for JIT-compiling the draw: events award a
+                # handful of prizes, so the bisect draws are nanoseconds
+                # against the surrounding round trips.
+                expires_at = None
+                if expires_in_days:
+                    expires_at = datetime.now() + timedelta(days=expires_in_days)
+
+                # Cumulative distributions are computed once per event,
+                # so each draw below is a single bisect instead of a
+                # linear scan over the tier/prize pools.
+                tier_cum_rates = list(
+                    accumulate(float(t['drop_rate']) for t in tiers)
+                )
+                prize_cum_weights = {
+                    tier_id: list(
+                        accumulate(p.get('mystery_weight', 100) for p in pool)
                     )
+                    for tier_id, pool in prizes_by_tier.items()
+                }
 
-                    if not user_info:
+                draws = []
+                for winner_user_id in winners:
+                    info = user_info.get(winner_user_id)
+                    if not info:
                         continue
 
-                    # Select random prize from tier
-                    tier_prizes = prizes_by_tier.get(tier['tier_id'], [])
+                    tier = self._roll_tier(tiers, tier_cum_rates)
+                    tier_id = tier['tier_id']
+                    tier_prizes = prizes_by_tier.get(tier_id, [])
                     if not tier_prizes:
                         # Fallback to common tier
+                        tier_id = 1
                         tier_prizes = prizes_by_tier.get(1, [])
+                    if not tier_prizes:
+                        continue
 
-                    if tier_prizes:
-                        # Weight selection by mystery_weight
-                        prize = self._weighted_random_choice(tier_prizes)
-
-                        # Award the prize
-                        award_result = await self.award_prize(
-                            prize_id=prize['prize_id'],
-                            user_id=winner_user_id,
-                            user_email=user_info['email'],
-                            source=AwardSource.MYSTERY_BOX,
-                            source_reference_id=event_id,
-                            source_reference_type='mystery_box_event',
-                            linked_award_id=linked_reward_id,
-                            expires_in_days=expires_in_days,
-                            metadata={
+                    # Weight selection by mystery_weight
+                    prize = self._weighted_random_choice(
+                        tier_prizes, prize_cum_weights.get(tier_id)
+                    )
+                    draws.append((winner_user_id, info, tier, prize))
+
+                # Deterministic (prize_id, user_id) order: the stock
+                # trigger updates prize_catalog per inserted row, so a
+                # stable ordering avoids deadlocks against concurrent
+                # single-prize awards touching the same rows.
+                draws.sort(key=lambda d: (d[3]['prize_id'], d[0]))
+
+                prizes_awarded = []
+                if draws:
+                    # Bulk insert: unnest parallel arrays into one
+                    # INSERT ... RETURNING, O(1) round trips however many
+                    # winners were drawn. Preferred over executemany
+                    # (N statements, no RETURNING) and COPY: COPY does
+                    # fire the stock trigger, but it has no RETURNING,
+                    # so the generated award_ids would need a temp-table
+                    # staging hop — more round trips than the single
+                    # INSERT at the winner counts events produce.
+                    # The SELECT re-checks each winner against the live
+                    # catalog row and the award summary — the same
+                    # stock/max_per_user/cooldown predicates as
+                    # _insert_award_sql — so stale cached pools or an
+                    # ineligible winner skip that row instead of letting
+                    # the stock trigger RAISE and abort the whole batch.
+                    # ROW_NUMBER caps within-batch draws of one prize to
+                    # its remaining stock; the trailing ORDER BY keeps
+                    # the (prize_id, user_id) insert order the deadlock
+                    # note above relies on.
+                    bulk_insert = f"""
+                        INSERT INTO {self._schema}.prize_awards (
+                            prize_id, user_id, user_email, user_employee_id,
+                            source, source_reference_id, source_reference_type,
+                            linked_award_id, status, expires_at,
+                            points_value, monetary_value, metadata
+                        )
+                        SELECT
+                            d.prize_id, d.user_id, d.user_email,
+                            d.user_employee_id,
+                            $6, $7, 'mystery_box_event',
+                            $8, $9, $10,
+                            COALESCE(pc.points_cost, 0), pc.monetary_value,
+                            d.metadata
+                        FROM (
+                            SELECT d.*,
+                                   ROW_NUMBER() OVER (
+                                       PARTITION BY d.prize_id
+                                       ORDER BY d.user_id
+                                   ) AS stock_rank
+                            FROM unnest(
+                                $1::int[], $2::int[], $3::text[], $4::text[],
+                                $5::jsonb[]
+                            ) AS d(
+                                prize_id, user_id, user_email,
+                                user_employee_id, metadata
+                            )
+                        ) d
+                        JOIN {self._schema}.prize_catalog pc
+                            ON pc.prize_id = d.prize_id
+                           AND pc.deleted_at IS NULL
+                        LEFT JOIN {self._schema}.prize_award_summary s
+                            ON s.prize_id = d.prize_id
+                           AND s.user_id = d.user_id
+                        WHERE pc.is_active
+                          AND (pc.total_quantity IS NULL
+                               OR (COALESCE(pc.available_quantity, 0)
+                                   - COALESCE(pc.reserved_quantity, 0))
+                                  >= d.stock_rank)
+                          AND (pc.max_per_user IS NULL
+                               OR COALESCE(s.awards_count, 0) < pc.max_per_user)
+                          AND (COALESCE(pc.cooldown_days, 0) = 0
+                               OR s.last_awarded_at IS NULL
+                               OR s.last_awarded_at
+                                  + (pc.cooldown_days * INTERVAL '1 day')
+                                  <= NOW())
+                        ORDER BY d.prize_id, d.user_id
+                        RETURNING award_id, user_id
+                    """
+                    awarded = await conn.fetch_all(bulk_insert, [
+                        [d[3]['prize_id'] for d in draws],
+                        [d[0] for d in draws],
+                        [d[1]['email'] for d in draws],
+                        [d[1].get('associate_id') for d in draws],
+                        [
+                            {
                                 'mystery_box_event_id': event_id,
-                                'tier_rolled': tier['tier_name'],
+                                'tier_rolled': d[2]['tier_name'],
                                 'event_name': event_name
-                            },
-                            user_employee_id=user_info.get('associate_id')
-                        )
-
-                        if award_result.success:
-                            prizes_awarded.append({
-                                'user_id': winner_user_id,
-                                'user_email': user_info['email'],
-                                'prize_id': prize['prize_id'],
-                                'prize_name': prize['prize_name'],
-                                'tier': tier['tier_name'],
-                                'tier_color': tier.get('color_code'),
-                                'award_id': award_result.award_id
-                            })
+                            }
+                            for d in draws
+                        ],
+                        AwardSource.MYSTERY_BOX.value,
+                        event_id,
+                        linked_reward_id,
+                        AwardStatus.AVAILABLE.value,
+                        expires_at
+                    ])
+                    award_ids = {r['user_id']: r['award_id'] for r in awarded}
+
+                    for winner_user_id, info, tier, prize in draws:
+                        award_id = award_ids.get(winner_user_id)
+                        if award_id is None:
+                            continue
+                        prizes_awarded.append({
+                            'user_id': winner_user_id,
+                            'user_email': info['email'],
+                            'prize_id': prize['prize_id'],
+                            'prize_name': prize['prize_name'],
+                            'category': prize.get('category_name'),
+                            'tier': tier['tier_name'],
+                            'tier_color': tier.get('color_code'),
+                            'award_id': award_id
+                        })
 
                 # Update event with results
                 await conn.execute(f"""
@@ -882,6 +1538,12 @@ class MarketplaceService:
                     f"{len(prizes_awarded)} prizes awarded to {len(winners)} winners"
                 )
 
+                # New awards change who is excluded by
+                # exclude_recent_winners_days, so the memoized eligibility
+                # lists are stale the moment prizes land.
+                if prizes_awarded:
+                    await self.invalidate_eligibility_cache()
+
                 return MysteryBoxResult(
                     success=True,
                     event_id=event_id,
@@ -903,6 +1565,22 @@ class MarketplaceService:
         criteria: Optional[Dict[str, Any]]
     ) -> List[int]:
         """Get eligible users based on criteria."""
+        # Events scheduled every half hour re-run the same tenure/group
+        # scan; memoize the user_id list in Redis keyed by the canonical
+        # criteria so only the first run per TTL pays for it.
+        cache_key = None
+        if self.cache is not None:
+            canonical = orjson.dumps(criteria or {}, option=orjson.OPT_SORT_KEYS)
+            cache_key = (
+                f"rewards:eligible:{hashlib.sha1(canonical).hexdigest()}"
+            )
+            try:
+                cached = await self.cache.get(cache_key)
+                if cached:
+                    return orjson.loads(cached)
+            except Exception as err:  # pylint: disable=W0703
+                self.logger.warning(f"Eligibility cache read failed: {err}")
+
         # Base query - active users
         query = """
             SELECT user_id FROM auth.users
@@ -918,7 +1596,30 @@ class MarketplaceService:
                 query += f" AND created_at <= NOW() - INTERVAL '{criteria['min_tenure_days']} days'"
 
         results = await conn.fetch_all(query, params)
-        return [r['user_id'] for r in results]
+        users = [r['user_id'] for r in results]
+
+        if cache_key is not None:
+            try:
+                await self.cache.set(cache_key, orjson.dumps(users), ex=300)
+            except Exception as err:  # pylint: disable=W0703
+                self.logger.warning(f"Eligibility cache write failed: {err}")
+
+        return users
+
+    async def invalidate_eligibility_cache(self) -> None:
+        """Drop all memoized eligibility lists.
+
+        Called after awards are written: criteria such as
+        ``exclude_recent_winners_days`` depend on the award history, so
+        every cached list may be stale regardless of its TTL.
+        """
+        if self.cache is None:
+            return
+        try:
+            async for key in self.cache.scan_iter(match="rewards:eligible:*"):
+                await self.cache.delete(key)
+        except Exception as err:  # pylint: disable=W0703
+            self.logger.warning(f"Eligibility cache invalidation failed: {err}")
 
     async def _get_mystery_box_tiers(
         self,
@@ -926,31 +1627,53 @@ class MarketplaceService:
         overrides: Optional[Dict[int, float]]
     ) -> List[Dict[str, Any]]:
         """Get tier drop rates."""
-        tiers = await conn.fetch_all(f"""
-            SELECT tier_id, tier_name, tier_level, drop_rate, color_code
-            FROM {self._schema}.prize_tiers
-            ORDER BY tier_level
-        """)
+        entry = _POOL_CACHE.get('tiers')
+        if entry and entry[0] > time.monotonic():
+            base = entry[1]
+        else:
+            tiers = await conn.fetch_all(f"""
+                SELECT tier_id, tier_name, tier_level, drop_rate, color_code
+                FROM {self._schema}.prize_tiers
+                ORDER BY tier_level
+            """)
+            base = [dict(t) for t in tiers]
+            _POOL_CACHE['tiers'] = (time.monotonic() + _POOL_CACHE_TTL, base)
 
-        result = [dict(t) for t in tiers]
+        # Copy before applying per-event overrides so the cached base
+        # rates stay pristine.
+        result = [dict(t) for t in base]
 
         if overrides:
             for tier in result:
                 if tier['tier_id'] in overrides:
-                    tier['drop_rate'] = Decimal(str(overrides[tier['tier_id']]))
+                    value = overrides[tier['tier_id']]
+                    # Scheduler configs pass pre-frozen Decimal overrides;
+                    # only ad-hoc float/str rates still need converting.
+                    if not isinstance(value, Decimal):
+                        value = Decimal(str(value))
+                    tier['drop_rate'] = value
 
         return result
 
     async def _get_mystery_eligible_prizes(self, conn) -> Dict[int, List[Dict]]:
         """Get all mystery-eligible prizes grouped by tier."""
+        entry = _POOL_CACHE.get('prizes')
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        # Join the category name here so winner payloads can be
+        # decorated entirely in-process: one pool query per TTL window,
+        # no per-winner lookups afterwards.
         query = f"""
-            SELECT prize_id, prize_name, tier_id, mystery_weight,
-                   monetary_value, image_url
-            FROM {self._schema}.prize_catalog
-            WHERE is_mystery_eligible = TRUE
-              AND is_active = TRUE
-              AND deleted_at IS NULL
-              AND (total_quantity IS NULL OR available_quantity > 0)
+            SELECT p.prize_id, p.prize_name, p.tier_id, p.mystery_weight,
+                   p.monetary_value, p.image_url, c.category_name
+            FROM {self._schema}.prize_catalog p
+            LEFT JOIN {self._schema}.prize_categories c
+                ON p.category_id = c.category_id
+            WHERE p.is_mystery_eligible = TRUE
+              AND p.is_active = TRUE
+              AND p.deleted_at IS NULL
+              AND (p.total_quantity IS NULL OR p.available_quantity > 0)
         """
 
         results = await conn.fetch_all(query)
@@ -962,32 +1685,37 @@ class MarketplaceService:
                 prizes_by_tier[tier_id] = []
             prizes_by_tier[tier_id].append(dict(row))
 
+        _POOL_CACHE['prizes'] = (
+            time.monotonic() + _POOL_CACHE_TTL, prizes_by_tier
+        )
         return prizes_by_tier
 
-    def _roll_tier(self, tiers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _roll_tier(
+        self,
+        tiers: List[Dict[str, Any]],
+        cum_rates: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
         """Roll for a tier based on drop rates."""
-        roll = random.random()
-        cumulative = 0
-
-        for tier in tiers:
-            cumulative += float(tier['drop_rate'])
-            if roll <= cumulative:
-                return tier
-
-        return tiers[0]  # Fallback to first tier
+        if cum_rates is None:
+            cum_rates = list(
+                accumulate(float(t['drop_rate']) for t in tiers)
+            )
+        idx = bisect_left(cum_rates, random.random())
+        if idx >= len(tiers):
+            return tiers[0]  # Fallback to first tier
+        return tiers[idx]
 
-    def _weighted_random_choice(self, prizes: List[Dict]) -> Dict:
+    def _weighted_random_choice(
+        self,
+        prizes: List[Dict],
+        cum_weights: Optional[List[int]] = None
+    ) -> Dict:
         """Select a prize weighted by mystery_weight."""
-        total_weight = sum(p.get('mystery_weight', 100) for p in prizes)
-        roll = random.randint(1, total_weight)
-
-        cumulative = 0
-        for prize in prizes:
-            cumulative += prize.get('mystery_weight', 100)
-            if roll <= cumulative:
-                return prize
-
-        return prizes[0]
+        if cum_weights is None:
+            cum_weights = list(
+                accumulate(p.get('mystery_weight', 100) for p in prizes)
+            )
+        return random.choices(prizes, cum_weights=cum_weights, k=1)[0]
 
     async def _update_event_status(
         self,
@@ -1029,7 +1757,7 @@ class MarketplaceService:
               AND ($2::timestamptz IS NULL OR initiated_at <= $2)
         """
 
-        async with await self.connection.acquire() as conn:
+        async with self._conn() as conn:
             result = await conn.fetchrow(query, [start_date, end_date])
             return dict(result) if result else {}
 
@@ -1057,23 +1785,51 @@ class MarketplaceService:
             LIMIT $1
         """
 
-        async with await self.connection.acquire() as conn:
+        async with self._conn() as conn:
             results = await conn.fetch_all(query, [limit])
             return [dict(r) for r in results]
 
-    async def expire_old_awards(self) -> int:
+    async def expire_old_awards(self, batch_size: int = 1000) -> int:
         """
         Expire awards that have passed their expiration date.
 
+        Works in bounded batches: each pass locks at most batch_size
+        rows with SKIP LOCKED, so the daily sweep never pins a long row
+        lock or fights user-facing transactions over the same awards.
+        The (status, expires_at) partial index covers the batch SELECT.
+
         Returns:
             Number of awards expired
         """
-        async with await self.connection.acquire() as conn:
-            result = await conn.fetchval(
-                f"SELECT {self._schema}.expire_old_awards()"
+        query = f"""
+            WITH batch AS (
+                SELECT award_id
+                FROM {self._schema}.prize_awards
+                WHERE status = 'available'
+                  AND expires_at IS NOT NULL
+                  AND expires_at < NOW()
+                ORDER BY expires_at
+                LIMIT $1
+                FOR UPDATE SKIP LOCKED
             )
-
-            if result and result > 0:
-                self.logger.info(f"Expired {result} old awards")
-
-            return result or 0
+            UPDATE {self._schema}.prize_awards pa
+            SET status = 'expired',
+                status_changed_at = NOW(),
+                updated_at = NOW()
+            FROM batch
+            WHERE pa.award_id = batch.award_id
+            RETURNING pa.award_id
+        """
+        total = 0
+        async with self._conn() as conn:
+            while True:
+                rows = await conn.fetch_all(query, [batch_size])
+                count = len(rows) if rows else 0
+                total += count
+                if count < batch_size:
+                    break
+
+        if total > 0:
+            self.logger.info(f"Expired {total} old awards")
+
+        return total
@@ -2,7 +2,7 @@ from typing import List, Optional, Any, Union
 import importlib
 import inspect
 import asyncio
-import json
+import orjson
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 import contextlib
@@ -1167,7 +1167,7 @@ AND deleted_at IS NULL
     @staticmethod
     def _escape_json_text(value: Any) -> str:
         """Escape text so it can be safely embedded inside JSON strings."""
-        escaped = json.dumps(value or "")
+        escaped = orjson.dumps(value or "").decode('utf-8')
         if len(escaped) >= 2 and escaped[0] == '"' and escaped[-1] == '"':
             return escaped[1:-1]
         return escaped
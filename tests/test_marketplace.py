@@ -0,0 +1,145 @@
+import sys
+import re
+from decimal import Decimal
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+# Mock navconfig before the service module imports it
+sys.modules['navconfig'] = MagicMock()
+sys.modules['navconfig.logging'] = MagicMock()
+
+from rewards.bonus import service as marketplace
+from rewards.bonus.service import (
+    MarketplaceService,
+    encode_catalog_cursor,
+    decode_catalog_cursor,
+    _redemption_code,
+    _CODE_ALPHABET,
+)
+
+
+def _stats_service(rows):
+    """Build a service whose wallet query returns the given rows.
+
+    Binding the mock connection through _ACTIVE_CONN exercises the real
+    _conn() reuse path without a pool.
+    """
+    service = MarketplaceService(connection=MagicMock())
+    conn = AsyncMock()
+    conn.fetch_all.return_value = rows
+    return service, conn
+
+
+@pytest.mark.asyncio
+async def test_wallet_stats_folds_group_rows():
+    """
+    Tests that the GROUP BY folding reproduces the old FILTER-aggregate
+    semantics: available excludes lapsed rows (but available_value does
+    not), and expired counts the whole 'expired' group plus the lapsed
+    rows of every other group.
+    """
+    service, conn = _stats_service([
+        {'status': 'available', 'total': 5, 'lapsed': 2,
+         'value': Decimal('100.00'), 'expiring_soon': 1},
+        {'status': 'redeemed', 'total': 3, 'lapsed': 0,
+         'value': Decimal('75.00'), 'expiring_soon': 0},
+        {'status': 'expired', 'total': 4, 'lapsed': 4,
+         'value': Decimal('40.00'), 'expiring_soon': 0},
+        {'status': 'reserved', 'total': 2, 'lapsed': 0,
+         'value': Decimal('20.00'), 'expiring_soon': 1},
+        {'status': 'cancelled', 'total': 2, 'lapsed': 1,
+         'value': Decimal('10.00'), 'expiring_soon': 0},
+    ])
+    token = marketplace._ACTIVE_CONN.set(conn)
+    try:
+        stats = await service.get_user_wallet_stats(1)
+    finally:
+        marketplace._ACTIVE_CONN.reset(token)
+
+    assert stats == {
+        'available_count': 3,
+        'redeemed_count': 3,
+        'expired_count': 7,
+        'pending_count': 2,
+        'available_value': Decimal('100.00'),
+        'redeemed_value': Decimal('75.00'),
+        'expiring_soon': 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_wallet_stats_empty_wallet():
+    """
+    Tests that a user with no wallet rows gets the all-zero stats dict
+    the old single-row FILTER query produced.
+    """
+    service, conn = _stats_service([])
+    token = marketplace._ACTIVE_CONN.set(conn)
+    try:
+        stats = await service.get_user_wallet_stats(1)
+    finally:
+        marketplace._ACTIVE_CONN.reset(token)
+
+    assert stats == {
+        'available_count': 0,
+        'redeemed_count': 0,
+        'expired_count': 0,
+        'pending_count': 0,
+        'available_value': 0,
+        'redeemed_value': 0,
+        'expiring_soon': 0,
+    }
+
+
+def test_catalog_cursor_round_trip():
+    """
+    Tests that an encoded cursor decodes back to the row's sort keys.
+    """
+    row = {
+        'is_featured': True,
+        'tier_level': 3,
+        'prize_name': 'Coffee Mug',
+        'prize_id': 42,
+    }
+    assert decode_catalog_cursor(encode_catalog_cursor(row)) == (
+        True, 3, 'Coffee Mug', 42
+    )
+
+
+def test_catalog_cursor_coalesces_null_tier():
+    """
+    Tests that an untiered prize (NULL tier_level from the LEFT JOIN)
+    encodes as tier 0 so the keyset predicate stays comparable.
+    """
+    row = {
+        'is_featured': False,
+        'tier_level': None,
+        'prize_name': 'Sticker Pack',
+        'prize_id': 7,
+    }
+    assert decode_catalog_cursor(encode_catalog_cursor(row)) == (
+        False, 0, 'Sticker Pack', 7
+    )
+
+
+def test_catalog_cursor_rejects_malformed_tokens():
+    """
+    Tests that garbage, non-list and wrong-arity tokens all decode to
+    None instead of raising.
+    """
+    assert decode_catalog_cursor('not-base64!') is None
+    assert decode_catalog_cursor('eyJhIjogMX0=') is None  # {"a": 1}
+    assert decode_catalog_cursor('WzEsIDJd') is None  # [1, 2]
+
+
+def test_redemption_code_shape():
+    """
+    Tests that generated codes match the RDM-XXXXX-XXXXX shape of the
+    SQL generate_redemption_code() function, using the same unambiguous
+    alphabet (no I/O/0/1).
+    """
+    for _ in range(50):
+        code = _redemption_code()
+        assert re.fullmatch(r'RDM-[A-Z2-9]{5}-[A-Z2-9]{5}', code)
+        assert all(c in _CODE_ALPHABET for c in code[4:].replace('-', ''))